@@ -0,0 +1,51 @@
+"""Add authz version counter
+
+Revision ID: b7d2e5a91c40
+Revises: e8c3b9be97c0
+Create Date: 2026-10-17 23:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e5a91c40'
+down_revision: Union[str, None] = 'e8c3b9be97c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ('roles', 'permissions', 'role_permissions')
+
+
+def upgrade() -> None:
+    op.create_table('authz_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.CheckConstraint('id = 1', name='ck_authz_version_single_row'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO authz_version (id, version) VALUES (1, 1)")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_authz_version() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE authz_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END
+        $$
+    """)
+    for table in VERSIONED_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_bump_authz_version "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION bump_authz_version()"
+        )
+
+
+def downgrade() -> None:
+    for table in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_authz_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_authz_version()")
+    op.drop_table('authz_version')
@@ -0,0 +1,67 @@
+"""Add article listing indexes
+
+Revision ID: e198a64289ba
+Revises: f4a7fa96e76e
+Create Date: 2026-10-17 21:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e198a64289ba'
+down_revision: Union[str, None] = 'f4a7fa96e76e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction, so every
+# statement goes through an autocommit block and the table stays writable.
+# A failed concurrent build leaves an INVALID index behind; IF NOT EXISTS /
+# IF EXISTS keep the migration re-runnable after dropping it by hand.
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_articles_created_at_id', 'articles',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_articles_status_created_at', 'articles',
+            ['status', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_articles_author_id_created_at', 'articles',
+            ['author_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        # Redundant with the primary key index.
+        op.drop_index(
+            'ix_articles_id', table_name='articles',
+            postgresql_concurrently=True, if_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_articles_id', 'articles', ['id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.drop_index(
+            'ix_articles_author_id_created_at', table_name='articles',
+            postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            'ix_articles_status_created_at', table_name='articles',
+            postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            'ix_articles_created_at_id', table_name='articles',
+            postgresql_concurrently=True, if_exists=True
+        )
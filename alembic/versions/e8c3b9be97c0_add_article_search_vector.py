@@ -0,0 +1,48 @@
+"""Add article search vector
+
+Revision ID: e8c3b9be97c0
+Revises: 48fe1535c2dc
+Create Date: 2026-10-17 22:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c3b9be97c0'
+down_revision: Union[str, None] = '48fe1535c2dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(body, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Adding a stored generated column rewrites the table under an exclusive lock;
+    # the GIN index is then built concurrently so writes resume straight away.
+    op.add_column('articles', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), nullable=True
+    ))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_articles_search_vector', 'articles', ['search_vector'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_articles_search_vector', table_name='articles',
+            postgresql_concurrently=True, if_exists=True
+        )
+    op.drop_column('articles', 'search_vector')
@@ -1,9 +1,15 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
 from uuid import UUID
+import math
+import time
 
+from app.core.cache import TTLCache, register_cache_metrics
 from app.core.config import settings
+from app.core.security import get_token_id
+from app.core.permissions import decode_permissions
+from app.core.rate_limit import login_throttle
 from app.core.authz import get_department_from_role, ensure_same_department_or_superadmin
 from app.schemas.auth import TokenData
 from app.services import auth_service
@@ -11,6 +17,13 @@ from app.services import auth_service
 
 security = HTTPBearer()
 
+# Validated claims by token digest, each kept until the token's own exp. Revocation
+# is still enforced because get_current_token checks it before every lookup here.
+verified_token_cache: TTLCache[TokenData] = TTLCache(
+    maxsize=settings.VERIFIED_TOKEN_CACHE_SIZE, ttl=0
+)
+register_cache_metrics("verified_token", verified_token_cache)
+
 
 class CurrentUser:
     """Wrapper for current user data from JWT token"""
@@ -32,7 +45,7 @@ async def get_current_token(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> str:
     token = credentials.credentials
-    if auth_service.is_access_token_revoked(token):
+    if await auth_service.is_access_token_revoked(token):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has been revoked",
@@ -44,6 +57,11 @@ async def get_current_token(
 async def get_current_user(
     token: str = Depends(get_current_token),
 ) -> TokenData:
+    token_id = get_token_id(token)
+    cached = verified_token_cache.get(token_id)
+    if cached is not None:
+        return cached
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -57,7 +75,8 @@ async def get_current_user(
         first_name: str = payload.get("first_name")
         last_name: str = payload.get("last_name")
         role_name: str = payload.get("role_name")
-        permissions: list = payload.get("permissions", [])
+        # Bitmask claims, or the name list of tokens issued before the permission registry
+        permissions = decode_permissions(payload)
         
         if user_id is None:
             raise credentials_exception
@@ -70,9 +89,12 @@ async def get_current_user(
             permissions=permissions
         )
         
-    except JWTError:
+    except (JWTError, ValueError):
         raise credentials_exception
     
+    expires_in = payload.get("exp", 0) - time.time()
+    if expires_in > 0:
+        verified_token_cache.set(token_id, token_data, ttl=expires_in)
     return token_data
 
 
@@ -129,3 +151,16 @@ def require_role(required_role: str):
             )
         return current_user
     return role_checker
+
+
+async def throttle_login(request: Request, email: str) -> None:
+    """Dependency that rejects a login attempt over its address or account rate"""
+    peer = request.client.host if request.client else None
+    address = login_throttle.address_of(peer, request.headers.get("x-forwarded-for"))
+    retry_after = login_throttle.check(address, email)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
@@ -1,10 +1,17 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, File, Form, Header, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import Literal, Optional, Union
 from uuid import UUID
 
+from app.core.config import settings
 from app.core.database import get_db
-from app.schemas.article import ArticleCreate, ArticleUpdate, ArticleResponse, ArticleWithAuthor
+from app.core.http_cache import make_etag, etag_matches, cache_headers, not_modified
+from app.core.responses import FastJSONResponse
+from app.schemas.article import ArticleCreate, ArticleUpdate, ArticleResponse, ArticleWithAuthor, ArticlePage
+from app.schemas.article import ArticleSummaryPage, ArticleSearchPage, ArticleBulkStatusRequest, ArticleBulkStatusResponse
+from app.models.article import ArticleStatus
 from app.services import article_service
 from app.api.v1.dependencies import CurrentUser, require_auth, require_permission
 
@@ -22,30 +29,136 @@ async def create_article(
     return await article_service.create_article(db, article_in, current_user.user_id)
 
 
-@router.get("/", response_model=List[ArticleWithAuthor])
+@router.get("/", response_model=Union[ArticlePage, ArticleSummaryPage])
 async def get_all_articles(
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    excerpt_length: int = Query(0, ge=0, le=settings.EXCERPT_LENGTH_MAX),
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get all published articles (public endpoint)"""
-    return await article_service.get_all_articles(db)
-
-
-@router.get("/my-articles", response_model=List[ArticleWithAuthor])
+    """Get all published articles, newest first (public endpoint, cursor paginated)
+
+    ``view=summary`` skips the article body and optionally returns an ``excerpt``.
+    The ETag covers the (id, updated_at) of every row on the page, so an unchanged
+    page is answered with 304 before any article is loaded.
+    """
+    versions = await article_service.get_article_page_version(db, limit=limit, cursor=cursor)
+    etag = make_etag(view, excerpt_length, limit, *versions)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    if view == "summary":
+        page = await article_service.get_article_summaries(
+            db, limit=limit, cursor=cursor, excerpt_length=excerpt_length, version=etag
+        )
+    else:
+        page = await article_service.get_all_articles(db, limit=limit, cursor=cursor, version=etag)
+    return FastJSONResponse(page, headers=cache_headers(etag))
+
+
+@router.get("/my-articles", response_model=Union[ArticlePage, ArticleSummaryPage])
 async def get_my_articles(
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    excerpt_length: int = Query(0, ge=0, le=settings.EXCERPT_LENGTH_MAX),
     current_user: CurrentUser = Depends(require_auth),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get current user's articles"""
-    return await article_service.get_my_articles(db, current_user.user_id)
+    """Get current user's articles, newest first (cursor paginated)
+
+    ``view=summary`` skips the article body and optionally returns an ``excerpt``.
+    """
+    if view == "summary":
+        page = await article_service.get_article_summaries(
+            db, limit=limit, cursor=cursor, author_id=current_user.user_id, excerpt_length=excerpt_length
+        )
+    else:
+        page = await article_service.get_my_articles(db, current_user.user_id, limit=limit, cursor=cursor)
+    return FastJSONResponse(page)
+
+
+@router.get("/search", response_model=ArticleSearchPage)
+async def search_articles(
+    q: str = Query(..., min_length=1, max_length=200),
+    article_status: ArticleStatus = Query(ArticleStatus.APPROVED, alias="status"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    offset: int = Query(0, ge=0, lt=settings.SEARCH_MAX_RESULTS),
+    db: AsyncSession = Depends(get_db)
+):
+    """Full-text search over article titles and bodies, best matches first (public endpoint)
+
+    ``q`` accepts web-search syntax: quoted phrases, ``or`` and ``-excluded`` terms.
+    Only approved articles are searched unless ``status`` says otherwise. Highlights
+    are HTML-escaped text with matches wrapped in ``<mark>``.
+    """
+    return await article_service.search_articles(db, q, limit=limit, offset=offset, status=article_status)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_articles(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    article_status: Optional[ArticleStatus] = Query(None, alias="status"),
+    author_id: Optional[UUID] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    current_user: CurrentUser = Depends(require_permission("article.archive"))
+):
+    """Stream every matching article as NDJSON or CSV (requires article.archive permission)
+
+    ``created_from`` is inclusive and ``created_to`` exclusive.
+    """
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        article_service.export_articles(
+            export_format,
+            status=article_status,
+            author_id=author_id,
+            created_from=created_from,
+            created_to=created_to
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="articles.{export_format}"'}
+    )
+
+
+@router.post("/bulk/approve", response_model=ArticleBulkStatusResponse)
+async def bulk_approve_articles(
+    payload: ArticleBulkStatusRequest,
+    current_user: CurrentUser = Depends(require_permission("article.approve")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Approve pending articles in one statement (requires article.approve permission)"""
+    return await article_service.bulk_transition_status(db, payload.ids, ArticleStatus.APPROVED, current_user)
+
+
+@router.post("/bulk/archive", response_model=ArticleBulkStatusResponse)
+async def bulk_archive_articles(
+    payload: ArticleBulkStatusRequest,
+    current_user: CurrentUser = Depends(require_permission("article.archive")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Archive articles in one statement (requires article.archive permission)"""
+    return await article_service.bulk_transition_status(db, payload.ids, ArticleStatus.ARCHIVED, current_user)
 
 
 @router.get("/{article_id}", response_model=ArticleWithAuthor)
 async def get_article(
     article_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get a specific article (public endpoint)"""
-    return await article_service.get_article(db, article_id)
+    """Get a specific article (public endpoint, conditional on its updated_at ETag)"""
+    updated_at = await article_service.get_article_version(db, article_id)
+    etag = make_etag(article_id, updated_at.isoformat())
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(cache_headers(etag))
+
+    return await article_service.get_article(db, article_id, updated_at=updated_at)
 
 
 @router.put("/{article_id}", response_model=ArticleResponse)
@@ -59,6 +172,18 @@ async def update_article(
     return await article_service.update_article(db, article_id, article_in, current_user)
 
 
+@router.post("/{article_id}/image", response_model=ArticleResponse)
+async def upload_article_image(
+    article_id: UUID,
+    file: UploadFile = File(...),
+    alt_text: str = Form(..., min_length=1, max_length=255),
+    current_user: CurrentUser = Depends(require_permission("article.update")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Upload an article's image and set its image_path and alt text (author or admin with article.update permission)"""
+    return await article_service.set_article_image(db, article_id, file, alt_text, current_user)
+
+
 @router.delete("/{article_id}", status_code=status.HTTP_200_OK)
 async def delete_article(
     article_id: UUID,
@@ -3,12 +3,12 @@ from app.core.database import get_db
 from app.services import auth_service
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import Token, RefreshTokenRequest
-from app.api.v1.dependencies import get_current_token
+from app.api.v1.dependencies import get_current_token, throttle_login
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/login", response_model=Token)
+@router.post("/login", response_model=Token, dependencies=[Depends(throttle_login)])
 async def login(email: str, password: str, db: AsyncSession = Depends(get_db)) -> Token:
     return await auth_service.authenticate_user(db=db, email=email, password=password)
 
@@ -21,8 +21,9 @@ async def refresh_token(payload: RefreshTokenRequest, db: AsyncSession = Depends
 @router.post("/logout")
 async def logout(
     payload: RefreshTokenRequest | None = None,
-    access_token: str = Depends(get_current_token)
+    access_token: str = Depends(get_current_token),
+    db: AsyncSession = Depends(get_db)
 ):
     refresh_token = payload.refresh_token if payload else None
-    auth_service.logout(access_token=access_token, refresh_token=refresh_token)
+    await auth_service.logout(db=db, access_token=access_token, refresh_token=refresh_token)
     return {"message": "Logged out successfully"}
\ No newline at end of file
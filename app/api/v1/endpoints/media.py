@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Header, Path
+from typing import Optional
+
+from app.services import image_service
+
+
+router = APIRouter(tags=["media"])
+
+
+@router.api_route("/images/{name}", methods=["GET", "HEAD"])
+async def get_image(
+    name: str = Path(..., pattern=r"^[A-Za-z0-9][A-Za-z0-9._-]*$", max_length=255),
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None)
+):
+    """Serve an uploaded image (public endpoint, supports Range and conditional requests)"""
+    return await image_service.image_response(
+        name,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since
+    )
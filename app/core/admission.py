@@ -0,0 +1,137 @@
+import asyncio
+from collections import deque
+from typing import Callable, Optional
+
+from .config import settings
+from .metrics import Counter, db_pool_recent_wait, register
+
+READ, WRITE, AUTH = "read", "write", "auth"
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+http_requests_shed = Counter("http_requests_shed_total", "Requests rejected by admission control, by class and reason")
+register(http_requests_shed)
+
+
+class ConcurrencyLimiter:
+    """At most ``limit`` holders at once, with up to ``queue_size`` callers waiting
+    for a slot in arrival order and none waiting longer than ``timeout`` seconds.
+    """
+
+    def __init__(self, limit: int, queue_size: int, timeout: float):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """Take a slot; False when the queue is full or the deadline passes first."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.timeout)
+            return True
+        except asyncio.TimeoutError:
+            if waiter.done():
+                # The slot was handed over just as the deadline passed; keep it
+                return True
+            self._waiters.remove(waiter)
+            waiter.cancel()
+            return False
+        except asyncio.CancelledError:
+            if waiter.done():
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+                waiter.cancel()
+            raise
+
+    def release(self) -> None:
+        # A freed slot passes straight to the next waiter, so ``active`` stays put
+        if self._waiters:
+            self._waiters.popleft().set_result(None)
+        else:
+            self.active -= 1
+
+    def stats(self) -> dict[str, int]:
+        return {"limit": self.limit, "active": self.active, "queued": self.queued, "queue_size": self.queue_size}
+
+
+class AdmissionController:
+    """Per-route-class concurrency limits, plus shedding while the DB pool is saturated.
+
+    Past the pool wait threshold every extra request would only queue for a
+    connection until it timed out, so new requests are refused outright until
+    checkouts speed up again.
+    """
+
+    def __init__(
+        self,
+        limiters: dict[str, ConcurrencyLimiter],
+        pool_wait: Callable[[], float],
+        pool_wait_threshold: float,
+        retry_after: int,
+    ):
+        self.limiters = limiters
+        self.pool_wait = pool_wait
+        self.pool_wait_threshold = pool_wait_threshold
+        self.retry_after = retry_after
+
+    @staticmethod
+    def route_class(method: str, path: str) -> Optional[str]:
+        """The class a request is limited under, or None for requests that are never limited."""
+        if not path.startswith("/api/"):
+            # Root, /metrics and media files need no database connection
+            return None
+        if path.startswith("/api/v1/auth/"):
+            return AUTH
+        return READ if method in READ_METHODS else WRITE
+
+    async def admit(self, route_class: str) -> Optional[str]:
+        """None once the request holds a slot in ``route_class``, else why it was shed."""
+        if self.pool_wait() > self.pool_wait_threshold:
+            reason = "pool_saturated"
+        elif await self.limiters[route_class].acquire():
+            return None
+        else:
+            reason = "queue_full_or_timeout"
+        http_requests_shed.inc((("class", route_class), ("reason", reason)))
+        return reason
+
+    def release(self, route_class: str) -> None:
+        self.limiters[route_class].release()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {name: limiter.stats() for name, limiter in self.limiters.items()}
+
+
+def create_admission_controller() -> AdmissionController:
+    def limiter(limit: int) -> ConcurrencyLimiter:
+        return ConcurrencyLimiter(
+            limit, queue_size=settings.ADMISSION_QUEUE_SIZE, timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS
+        )
+
+    return AdmissionController(
+        limiters={
+            READ: limiter(settings.ADMISSION_READ_CONCURRENCY),
+            WRITE: limiter(settings.ADMISSION_WRITE_CONCURRENCY),
+            AUTH: limiter(settings.ADMISSION_AUTH_CONCURRENCY),
+        },
+        pool_wait=db_pool_recent_wait.value,
+        pool_wait_threshold=settings.ADMISSION_POOL_WAIT_THRESHOLD_SECONDS,
+        retry_after=settings.ADMISSION_RETRY_AFTER_SECONDS,
+    )
+
+
+admission_controller = create_admission_controller()
@@ -25,3 +25,14 @@ def ensure_same_department_or_superadmin(current_user: "CurrentUser", target_rol
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Cross-department access is not allowed"
         )
+
+
+def get_allowed_author_roles(current_user: "CurrentUser") -> list[str] | None:
+    """Author roles whose articles ``current_user`` may change, for filtering in SQL.
+
+    Mirrors ``ensure_same_department_or_superadmin``; ``None`` means unrestricted.
+    """
+    if current_user.role_name == "super_admin":
+        return None
+    department = get_department_from_role(current_user.role_name)
+    return [f"author_{department}"] if department else []
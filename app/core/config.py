@@ -1,11 +1,40 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
 
     DATABASE_URL: str
 
+    # Connection profile: "pgbouncer" for a transaction-mode pooler in front of Postgres
+    # (no server-side prepared statement caching), "direct" for a plain Postgres connection
+    DB_PROFILE: Literal["pgbouncer", "direct"] = "pgbouncer"
+    # Connections kept open per worker, and extra ones allowed under burst
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # Seconds to wait for a pooled connection before raising
+    DB_POOL_TIMEOUT: float = 30.0
+    # Seconds after which a connection is replaced; -1 keeps connections forever
+    DB_POOL_RECYCLE: int = 1800
+    # Prepared statement cache per connection; None uses the profile default (off for pgbouncer)
+    DB_STATEMENT_CACHE: Optional[bool] = None
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Postgres JIT mostly adds planning latency to short OLTP queries
+    DB_JIT: bool = False
+
+    # Admission control: requests handled at once per route class, each with a bounded
+    # queue in front. A request that cannot get a slot in time gets 503 with Retry-After
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_READ_CONCURRENCY: int = 64
+    ADMISSION_WRITE_CONCURRENCY: int = 16
+    ADMISSION_AUTH_CONCURRENCY: int = 8
+    ADMISSION_QUEUE_SIZE: int = 64
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    # New requests are shed while pool checkouts wait longer than this
+    ADMISSION_POOL_WAIT_THRESHOLD_SECONDS: float = 0.5
+    ADMISSION_RETRY_AFTER_SECONDS: int = 2
+
     ALLOWED_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:5174"]
 
     SECRET_KEY: str
@@ -14,6 +43,59 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_DAYS: int = 7
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
 
+    # "database" persists logouts across restarts and workers; "memory" is per-process
+    TOKEN_REVOCATION_BACKEND: Literal["database", "memory"] = "database"
+    # How often each worker pulls revocations made by other workers
+    TOKEN_REVOCATION_SYNC_SECONDS: float = 5.0
+
+    # Verified access tokens kept per worker so repeat requests skip JWT decoding; 0 disables
+    VERIFIED_TOKEN_CACHE_SIZE: int = 4096
+
+    # argon2 runs off the event loop; "thread" suffices since argon2-cffi releases the GIL
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    # Jobs handed to the executor at once (defaults to PASSWORD_HASH_WORKERS); the rest queue
+    PASSWORD_HASH_MAX_CONCURRENCY: Optional[int] = None
+
+    # Login attempts per client address and per account: a burst, then a steady refill.
+    # Throttled attempts get 429 before any database or hashing work
+    LOGIN_THROTTLE_ENABLED: bool = True
+    LOGIN_RATE_ADDRESS_BURST: int = 20
+    LOGIN_RATE_ADDRESS_PER_MINUTE: float = 10.0
+    LOGIN_RATE_ACCOUNT_BURST: int = 5
+    LOGIN_RATE_ACCOUNT_PER_MINUTE: float = 3.0
+    # Buckets kept per worker for each of the two limits; idle ones are dropped first
+    LOGIN_THROTTLE_MAX_KEYS: int = 100_000
+    # Reverse proxies (addresses or CIDRs) whose X-Forwarded-For is trusted to name the
+    # client. Behind a proxy this must be set (or uvicorn run with --proxy-headers
+    # --forwarded-allow-ips), otherwise every login shares the proxy's address bucket
+    TRUSTED_PROXIES: list[str] = []
+
+    PAGE_SIZE_DEFAULT: int = 20
+    PAGE_SIZE_MAX: int = 100
+    EXCERPT_LENGTH_MAX: int = 500
+    # Deepest result a search can page to
+    SEARCH_MAX_RESULTS: int = 200
+    # Rows fetched per server-side cursor round trip when exporting
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # Seconds browsers and proxies may reuse a public response before revalidating with its ETag
+    PUBLIC_CACHE_MAX_AGE: int = 0
+
+    # In-process article read cache; size 0 disables it
+    ARTICLE_CACHE_SIZE: int = 1024
+    LISTING_CACHE_SIZE: int = 256
+    ARTICLE_CACHE_TTL_SECONDS: float = 60.0
+
+    # Uploaded files are stored under MEDIA_ROOT and referenced by paths under MEDIA_URL
+    MEDIA_ROOT: str = "media"
+    MEDIA_URL: str = "/media"
+    IMAGE_UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024
+    IMAGE_UPLOAD_CHUNK_SIZE: int = 64 * 1024
+    # Widths of the downscaled copies generated for each new image
+    IMAGE_VARIANT_WIDTHS: list[int] = [320, 640, 1280]
+    IMAGE_RESIZE_WORKERS: int = 2
+
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
 
@@ -1,18 +1,95 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from .config import settings
+from .metrics import Gauge, db_pool_recent_wait, record_pool_wait, record_query, register
+
+logger = logging.getLogger("uvicorn.error")
+
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    future=True,
-    pool_pre_ping=True,
-    connect_args={
-        "statement_cache_size": 0,
-        "prepared_statement_cache_size": 0,
-        "server_settings": {"jit": "off"}
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Records how long each checkout waited for a free (or newly opened) connection."""
+
+    def _do_get(self):
+        started = db_pool_recent_wait.begin()
+        try:
+            return super()._do_get()
+        finally:
+            record_pool_wait(db_pool_recent_wait.end(started))
+
+
+def engine_options(profile: Optional[str] = None) -> dict:
+    """Keyword arguments for ``create_async_engine`` under a DB profile (see Settings)."""
+    profile = profile or settings.DB_PROFILE
+    statement_cache = settings.DB_STATEMENT_CACHE
+    if statement_cache is None:
+        statement_cache = profile == "direct"
+    cache_size = settings.DB_STATEMENT_CACHE_SIZE if statement_cache else 0
+
+    return {
+        "echo": False,
+        "future": True,
+        "pool_pre_ping": True,
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "connect_args": {
+            "statement_cache_size": cache_size,
+            "prepared_statement_cache_size": cache_size,
+            "server_settings": {"jit": "on" if settings.DB_JIT else "off"}
+        }
     }
-)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time every SQL statement; see app.core.metrics for where it is reported."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        record_query(time.perf_counter() - conn.info["query_started"].pop())
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+        if started:
+            record_query(time.perf_counter() - started.pop())
+
+
+def create_engine(profile: Optional[str] = None) -> AsyncEngine:
+    engine = create_async_engine(settings.DATABASE_URL, **engine_options(profile))
+    instrument_engine(engine)
+    return engine
+
+
+def log_engine_profile() -> None:
+    options = engine_options()
+    logger.info(
+        "Database profile '%s': pool_size=%s max_overflow=%s pool_timeout=%ss pool_recycle=%ss "
+        "statement_cache_size=%s jit=%s",
+        settings.DB_PROFILE,
+        options["pool_size"],
+        options["max_overflow"],
+        options["pool_timeout"],
+        options["pool_recycle"],
+        options["connect_args"]["statement_cache_size"],
+        options["connect_args"]["server_settings"]["jit"],
+    )
+
+
+engine = create_engine()
+register(Gauge("db_pool_checked_out", "Connections currently checked out", callback=lambda: engine.pool.checkedout()))
 
 
 AsyncSessionLocal = async_sessionmaker(
@@ -30,4 +107,4 @@ async def get_db():
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from .config import settings
+from .metrics import Gauge, register
+
+T = TypeVar("T")
+
+
+class HashingPool:
+    """Runs CPU-bound password hashing in an executor so it never blocks the event loop.
+
+    At most ``max_concurrency`` jobs are handed to the executor at once; the rest
+    wait on a semaphore, which is what ``queue_depth`` reports. The semaphore is
+    created on first use inside the running event loop (and again if a later
+    loop, e.g. a new test or ``asyncio.run``, uses the pool), never at import.
+    """
+
+    # Recent latencies kept for percentile reporting
+    SAMPLE_SIZE = 1024
+
+    def __init__(self, executor: Executor, max_concurrency: int):
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.queue_depth = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.max_queue_depth = 0
+        self._wait_samples: deque[float] = deque(maxlen=self.SAMPLE_SIZE)
+        self._run_samples: deque[float] = deque(maxlen=self.SAMPLE_SIZE)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        semaphore = self._get_semaphore()
+        queued_at = time.perf_counter()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            await semaphore.acquire()
+        finally:
+            self.queue_depth -= 1
+
+        started_at = time.perf_counter()
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+            semaphore.release()
+            self.completed += 1
+            self._wait_samples.append(started_at - queued_at)
+            self._run_samples.append(time.perf_counter() - started_at)
+
+    @staticmethod
+    def _percentile(samples: deque[float], fraction: float) -> Optional[float]:
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def stats(self) -> dict[str, Optional[float]]:
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "wait_p50_seconds": self._percentile(self._wait_samples, 0.50),
+            "wait_p99_seconds": self._percentile(self._wait_samples, 0.99),
+            "run_p50_seconds": self._percentile(self._run_samples, 0.50),
+            "run_p99_seconds": self._percentile(self._run_samples, 0.99),
+        }
+
+
+def create_hashing_pool() -> HashingPool:
+    executor: Executor
+    if settings.PASSWORD_HASH_EXECUTOR == "process":
+        executor = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+    else:
+        executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+    max_concurrency = settings.PASSWORD_HASH_MAX_CONCURRENCY or settings.PASSWORD_HASH_WORKERS
+    return HashingPool(executor, max_concurrency=max_concurrency)
+
+
+hashing_pool = create_hashing_pool()
+
+
+def _latency_gauge(name: str, help_text: str, samples: deque[float], fraction: float) -> Gauge:
+    # 0 until the first job completes
+    return Gauge(name, help_text, callback=lambda: HashingPool._percentile(samples, fraction) or 0.0)
+
+
+register(Gauge("password_hash_queue_depth", "Hashing jobs waiting for an executor slot",
+               callback=lambda: hashing_pool.queue_depth))
+register(Gauge("password_hash_in_flight", "Hashing jobs running in the executor",
+               callback=lambda: hashing_pool.in_flight))
+register(_latency_gauge("password_hash_wait_p50_seconds", "Median wait for an executor slot, recent jobs",
+                        hashing_pool._wait_samples, 0.50))
+register(_latency_gauge("password_hash_wait_p99_seconds", "p99 wait for an executor slot, recent jobs",
+                        hashing_pool._wait_samples, 0.99))
+register(_latency_gauge("password_hash_run_p50_seconds", "Median hashing time, recent jobs",
+                        hashing_pool._run_samples, 0.50))
+register(_latency_gauge("password_hash_run_p99_seconds", "p99 hashing time, recent jobs",
+                        hashing_pool._run_samples, 0.99))
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .config import settings
+
+logger = logging.getLogger("uvicorn.error")
+
+# Leading bytes of each accepted format and the extension it is stored under
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+)
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """Extension for the image format ``head`` starts with; the client's content type is not trusted."""
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    for signature, extension in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    return None
+
+
+def image_dir() -> Path:
+    return Path(settings.MEDIA_ROOT) / "images"
+
+
+def upload_tmp_dir() -> Path:
+    """Files being written; outside image_dir so half-written files are never served."""
+    return Path(settings.MEDIA_ROOT) / "tmp"
+
+
+def variant_path(source: Path, width: int) -> Path:
+    return source.with_name(f"{source.stem}_{width}w{source.suffix}")
+
+
+def resize_variants(source: str, widths: Sequence[int]) -> list[str]:
+    """Write a downscaled copy of ``source`` for every width narrower than the original.
+
+    Runs in a worker process. Existing variants are left alone, and each file is
+    written under a temporary name first so readers never see a partial image.
+    """
+    from PIL import Image
+
+    written = []
+    source_path = Path(source)
+    with Image.open(source_path) as image:
+        image_format = image.format
+        for width in sorted(widths):
+            target = variant_path(source_path, width)
+            if width >= image.width or target.exists():
+                continue
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            if image_format == "JPEG" and resized.mode not in ("RGB", "L"):
+                resized = resized.convert("RGB")
+            fd, partial = tempfile.mkstemp(dir=upload_tmp_dir(), suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    resized.save(out, format=image_format)
+                os.replace(partial, target)
+            except BaseException:
+                os.unlink(partial)
+                raise
+            written.append(str(target))
+    return written
+
+
+class ImageVariantPool:
+    """Generates resized variants in worker processes without the request awaiting them.
+
+    A failed job is logged and leaves the original in place; variants are only
+    an optimization for clients that ask for them.
+    """
+
+    def __init__(self, executor: ProcessPoolExecutor, widths: Sequence[int]):
+        self.executor = executor
+        self.widths = tuple(widths)
+        self._pending: dict[str, asyncio.Future] = {}
+
+    def submit(self, source: Path) -> None:
+        key = str(source)
+        if key in self._pending or not self.widths:
+            return
+        future = asyncio.get_running_loop().run_in_executor(self.executor, resize_variants, key, self.widths)
+        self._pending[key] = future
+        future.add_done_callback(lambda done: self._finished(key, done))
+
+    def _finished(self, key: str, future: asyncio.Future) -> None:
+        self._pending.pop(key, None)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Resizing %s failed", key, exc_info=future.exception())
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+
+def create_image_variant_pool() -> ImageVariantPool:
+    executor = ProcessPoolExecutor(max_workers=settings.IMAGE_RESIZE_WORKERS)
+    return ImageVariantPool(executor, widths=settings.IMAGE_VARIANT_WIDTHS)
+
+
+image_variant_pool = create_image_variant_pool()
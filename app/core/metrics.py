@@ -0,0 +1,205 @@
+import bisect
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional, Sequence
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _format_labels(labels: Labels, extra: Optional[tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (
+        name + '="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+
+
+class Gauge:
+    """A value that is set directly, or read from ``callback`` at render time."""
+
+    def __init__(self, name: str, help_text: str, callback: Optional[Callable[[], float]] = None):
+        self.name = name
+        self.help_text = help_text
+        self.callback = callback
+        self.value = 0.0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+    def render(self) -> Iterable[str]:
+        value = self.callback() if self.callback is not None else self.value
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} gauge"
+        yield f"{self.name} {_format_value(value)}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus exposition format."""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        # labels -> (per-bucket counts including +Inf, sum)
+        self._series: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = series
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(labels, ('le', _format_value(bound)))} {cumulative}"
+            cumulative += counts[-1]
+            yield f"{self.name}_bucket{_format_labels(labels, ('le', '+Inf'))} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(labels)} {_format_value(total[0])}"
+            yield f"{self.name}_count{_format_labels(labels)} {cumulative}"
+
+
+@dataclass
+class RequestStats:
+    """Database work attributed to the request being handled."""
+    started: float = field(default_factory=time.perf_counter)
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+
+
+class RecentWait:
+    """How long pool checkouts are waiting right now.
+
+    The larger of a decaying average of finished waits (halving every
+    ``half_life`` seconds without new ones) and the age of the oldest wait
+    still in progress, so a stalled pool shows up before any checkout returns.
+    """
+
+    # Weight of each finished wait in the average
+    SMOOTHING = 0.2
+
+    def __init__(self, half_life: float):
+        self.half_life = half_life
+        self._average = 0.0
+        self._updated = time.perf_counter()
+        self._pending: list[float] = []
+
+    def _decayed(self, now: float) -> float:
+        return self._average * 0.5 ** ((now - self._updated) / self.half_life)
+
+    def begin(self) -> float:
+        started = time.perf_counter()
+        self._pending.append(started)
+        return started
+
+    def end(self, started: float) -> float:
+        """Finish the wait begun at ``started`` and return its duration."""
+        now = time.perf_counter()
+        self._pending.remove(started)
+        elapsed = now - started
+        average = self._decayed(now)
+        self._average = average + (elapsed - average) * self.SMOOTHING
+        self._updated = now
+        return elapsed
+
+    def value(self) -> float:
+        now = time.perf_counter()
+        oldest = now - min(self._pending) if self._pending else 0.0
+        return max(self._decayed(now), oldest)
+
+
+# Set by MetricsMiddleware; engine and pool hooks add to it. Tasks and SQLAlchemy's
+# greenlets inherit the context, so they update the same object.
+current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+http_requests_in_flight = Gauge("http_requests_in_flight", "Requests currently being handled")
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "Time to produce the response, by route", LATENCY_BUCKETS
+)
+http_responses = Counter("http_responses_total", "Responses by route and status code")
+http_request_db_queries = Histogram(
+    "http_request_db_queries", "SQL statements executed per request, by route", QUERY_COUNT_BUCKETS
+)
+http_request_db_duration = Histogram(
+    "http_request_db_seconds", "Time spent in SQL statements per request, by route", LATENCY_BUCKETS
+)
+db_queries = Counter("db_queries_total", "SQL statements executed")
+db_query_duration = Histogram("db_query_duration_seconds", "Time per SQL statement", LATENCY_BUCKETS)
+db_pool_checkout_wait = Histogram(
+    "db_pool_checkout_wait_seconds", "Time waited for a pooled connection", LATENCY_BUCKETS
+)
+# Read by admission control to shed load while the pool is saturated
+db_pool_recent_wait = RecentWait(half_life=2.0)
+
+REGISTRY: list = [
+    http_requests_in_flight,
+    http_request_duration,
+    http_responses,
+    http_request_db_queries,
+    http_request_db_duration,
+    db_queries,
+    db_query_duration,
+    db_pool_checkout_wait,
+    Gauge("db_pool_recent_wait_seconds", "Current pool checkout wait", callback=db_pool_recent_wait.value),
+]
+
+
+def record_query(elapsed: float) -> None:
+    db_queries.inc()
+    db_query_duration.observe(elapsed)
+    stats = current_request.get()
+    if stats is not None:
+        stats.db_queries += 1
+        stats.db_seconds += elapsed
+
+
+def record_pool_wait(elapsed: float) -> None:
+    db_pool_checkout_wait.observe(elapsed)
+    stats = current_request.get()
+    if stats is not None:
+        stats.pool_wait_seconds += elapsed
+
+
+def register(metric) -> None:
+    REGISTRY.append(metric)
+
+
+def render_metrics() -> str:
+    return "\n".join(line for metric in REGISTRY for line in metric.render()) + "\n"
@@ -0,0 +1,55 @@
+from functools import lru_cache
+from typing import Any, Iterable
+
+# Permission names by bit position, per registry version. A token records the
+# version it was encoded with, so published versions must never change: to add,
+# rename or drop a permission, add a new version and keep the old ones for the
+# lifetime of the tokens that use them.
+PERMISSION_REGISTRY: dict[int, tuple[str, ...]] = {
+    1: ("user.manage", "article.create", "article.archive", "article.approve", "article.update"),
+}
+CURRENT_REGISTRY_VERSION = max(PERMISSION_REGISTRY)
+
+_BITS = {name: 1 << index for index, name in enumerate(PERMISSION_REGISTRY[CURRENT_REGISTRY_VERSION])}
+
+
+def encode_permissions(permissions: Iterable[str]) -> dict[str, Any]:
+    """Token claims for ``permissions``: registry version ``pv`` and bitmask ``pm``.
+
+    Names the registry does not know yet are carried verbatim in ``px`` so a
+    permission added to the database works before the registry catches up.
+    """
+    mask = 0
+    extra = []
+    for name in permissions:
+        bit = _BITS.get(name)
+        if bit is None:
+            extra.append(name)
+        else:
+            mask |= bit
+    claims: dict[str, Any] = {"pv": CURRENT_REGISTRY_VERSION, "pm": mask}
+    if extra:
+        claims["px"] = sorted(extra)
+    return claims
+
+
+@lru_cache(maxsize=1024)
+def _decode(version: int, mask: int, extra: tuple[str, ...]) -> frozenset[str]:
+    names = PERMISSION_REGISTRY[version]
+    return frozenset(name for index, name in enumerate(names) if mask >> index & 1).union(extra)
+
+
+def decode_permissions(claims: dict[str, Any]) -> frozenset[str]:
+    """Permission names from token ``claims``, in either encoding.
+
+    Tokens issued before the registry carry a plain ``permissions`` list. Raises
+    ``ValueError`` for a registry version this build does not know.
+    """
+    if "pm" not in claims:
+        return frozenset(claims.get("permissions") or ())
+
+    version = claims.get("pv")
+    mask = claims["pm"]
+    if version not in PERMISSION_REGISTRY or not isinstance(mask, int) or mask < 0:
+        raise ValueError(f"Unknown permission encoding (version {version!r})")
+    return _decode(version, mask, tuple(claims.get("px") or ()))
@@ -0,0 +1,172 @@
+import ipaddress
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Sequence
+
+from .config import settings
+
+Network = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets: ``burst`` attempts at once, refilled at ``rate`` per second.
+
+    Buckets are kept least recently used first. A bucket left alone long enough
+    to refill completely behaves exactly like a missing one, so idle buckets are
+    dropped from the front as new keys arrive; past ``maxsize`` keys the least
+    recently used bucket is dropped even if it is not full yet. Memory is
+    therefore bounded by ``maxsize`` whatever the number of distinct keys.
+    """
+
+    def __init__(self, burst: int, rate: float, maxsize: int):
+        self.burst = burst
+        self.rate = rate
+        self.maxsize = maxsize
+        self.idle_seconds = burst / rate if rate > 0 else float("inf")
+        self.allowed = 0
+        self.rejected = 0
+        self.evictions = 0
+        # key -> (tokens left, monotonic time they were counted)
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+
+    def acquire(self, key: Hashable, now: Optional[float] = None) -> float:
+        """Take one token for ``key``: 0 when allowed, else seconds until one is available."""
+        now = time.monotonic() if now is None else now
+        entry = self._buckets.get(key)
+        if entry is None:
+            tokens = float(self.burst)
+            self._evict(now)
+        else:
+            tokens, counted_at = entry
+            tokens = min(float(self.burst), tokens + (now - counted_at) * self.rate)
+
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now)
+            self._buckets.move_to_end(key)
+            self.allowed += 1
+            return 0.0
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        self.rejected += 1
+        return (1 - tokens) / self.rate if self.rate > 0 else float("inf")
+
+    def _evict(self, now: float) -> None:
+        while self._buckets:
+            key, (_, counted_at) = next(iter(self._buckets.items()))
+            if now - counted_at < self.idle_seconds and len(self._buckets) < self.maxsize:
+                return
+            del self._buckets[key]
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._buckets),
+            "maxsize": self.maxsize,
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "evictions": self.evictions,
+        }
+
+
+def _parse_networks(entries: Sequence[str]) -> tuple[Network, ...]:
+    return tuple(ipaddress.ip_network(entry.strip(), strict=False) for entry in entries)
+
+
+def _is_trusted(address: str, networks: Sequence[Network]) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in networks)
+
+
+def client_address(
+    peer: Optional[str],
+    forwarded_for: Optional[str],
+    trusted_proxies: Sequence[Network],
+) -> Optional[str]:
+    """The address to throttle a request under.
+
+    ``peer`` is the connecting address. When it is a trusted proxy, the
+    ``X-Forwarded-For`` hops are walked from the right (the ones our proxies
+    appended) and the first address that is not a trusted proxy is the client;
+    anything further left was written by the client and is ignored.
+    """
+    if peer is None or not forwarded_for or not _is_trusted(peer, trusted_proxies):
+        return peer
+    for hop in reversed(forwarded_for.split(",")):
+        hop = hop.strip()
+        if not _is_trusted(hop, trusted_proxies):
+            return hop or peer
+    return peer
+
+
+class LoginThrottle:
+    """Token buckets per client address and per account, checked before a login
+    touches the database or the password hasher.
+
+    The address bucket caps what one source can try across many accounts; the
+    account bucket caps guesses against one account from many sources.
+    """
+
+    # Longest valid email address; longer input is truncated so keys stay small
+    MAX_ACCOUNT_KEY_LENGTH = 320
+
+    def __init__(
+        self,
+        by_address: TokenBucketLimiter,
+        by_account: TokenBucketLimiter,
+        enabled: bool = True,
+        trusted_proxies: Sequence[str] = (),
+    ):
+        self.by_address = by_address
+        self.by_account = by_account
+        self.enabled = enabled
+        self.trusted_proxies = _parse_networks(trusted_proxies)
+
+    def address_of(self, peer: Optional[str], forwarded_for: Optional[str]) -> Optional[str]:
+        return client_address(peer, forwarded_for, self.trusted_proxies)
+
+    def check(self, address: Optional[str], email: str) -> float:
+        """0 when the attempt may proceed, else seconds the client should wait."""
+        if not self.enabled:
+            return 0.0
+        retry_after = self.by_address.acquire(address or "unknown")
+        if retry_after:
+            # The account bucket is left alone so one source cannot drain it by itself
+            return retry_after
+        return self.by_account.acquire(email.strip().lower()[:self.MAX_ACCOUNT_KEY_LENGTH])
+
+    def clear(self) -> None:
+        self.by_address.clear()
+        self.by_account.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {"by_address": self.by_address.stats(), "by_account": self.by_account.stats()}
+
+
+def create_login_throttle() -> LoginThrottle:
+    return LoginThrottle(
+        by_address=TokenBucketLimiter(
+            burst=settings.LOGIN_RATE_ADDRESS_BURST,
+            rate=settings.LOGIN_RATE_ADDRESS_PER_MINUTE / 60,
+            maxsize=settings.LOGIN_THROTTLE_MAX_KEYS,
+        ),
+        by_account=TokenBucketLimiter(
+            burst=settings.LOGIN_RATE_ACCOUNT_BURST,
+            rate=settings.LOGIN_RATE_ACCOUNT_PER_MINUTE / 60,
+            maxsize=settings.LOGIN_THROTTLE_MAX_KEYS,
+        ),
+        enabled=settings.LOGIN_THROTTLE_ENABLED,
+        trusted_proxies=settings.TRUSTED_PROXIES,
+    )
+
+
+login_throttle = create_login_throttle()
@@ -0,0 +1,16 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class FastJSONResponse(ORJSONResponse):
+    """orjson-encoded response for content that is already serialization-ready.
+
+    Returning it from a route skips ``response_model`` validation while the model
+    still documents the schema. UUIDs, enums and datetimes are encoded natively;
+    UTC offsets are written as ``Z``, the same as pydantic.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
@@ -1,31 +1,45 @@
+import hashlib
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from jose import jwt
+from jose import jwt, JWTError
 from passlib.context import CryptContext
 from .config import settings
+from .hashing import hashing_pool
+from .permissions import encode_permissions
 from app.schemas import TokenData
 
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+# Module-level so they can be pickled into a process pool
+def _verify(secret: str, hashed: str) -> bool:
+    return pwd_context.verify(secret, hashed)
 
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+def _hash(secret: str) -> str:
+    return pwd_context.hash(secret)
 
 
-def verify_otp(plain_otp: str, hashed_otp: str) -> bool:
-    return pwd_context.verify(plain_otp, hashed_otp)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await hashing_pool.run(_verify, plain_password, hashed_password)
 
 
-def get_otp_hash(otp: str) -> str:
-    return pwd_context.hash(otp)
+async def get_password_hash(password: str) -> str:
+    return await hashing_pool.run(_hash, password)
+
+
+async def verify_otp(plain_otp: str, hashed_otp: str) -> bool:
+    return await hashing_pool.run(_verify, plain_otp, hashed_otp)
+
+
+async def get_otp_hash(otp: str) -> str:
+    return await hashing_pool.run(_hash, otp)
 
 
 def create_access_token(data: TokenData, expires_delta: Optional[timedelta] = None) -> str:
-    to_encode = data.model_dump(mode='json')
+    # Permissions travel as a registry bitmask rather than a list of names
+    to_encode = data.model_dump(mode='json', exclude={"permissions"})
+    to_encode.update(encode_permissions(data.permissions))
 
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -34,4 +48,20 @@ def create_access_token(data: TokenData, expires_delta: Optional[timedelta] = No
         
     to_encode.update({"exp": int(expire.timestamp())})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
\ No newline at end of file
+    return encoded_jwt
+
+
+def get_token_id(token: str) -> str:
+    """Compact, non-reversible id for an encoded token"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_token_expiry(token: str, default: timedelta) -> datetime:
+    """``exp`` of a token without verifying it, or now + ``default`` if it has none"""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        exp = None
+    if isinstance(exp, (int, float)):
+        return datetime.fromtimestamp(exp, timezone.utc)
+    return datetime.now(timezone.utc) + default
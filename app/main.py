@@ -1,31 +1,67 @@
 import os
 import sys
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 if __name__ == "__main__" and __package__ is None:
     sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
+from app.middleware.admission import setup_admission
 from app.middleware.cors import setup_cors
+from app.middleware.metrics import setup_metrics
+from app.middleware.upload_limit import setup_upload_limit
 from app.api.v1.router import api_router
+from app.api.v1.endpoints import media
+from app.core.config import settings
+from app.core.database import engine, log_engine_profile
+from app.core.metrics import render_metrics
+from app.services import auth_service
+from app.services.role_permissions import role_permission_snapshot
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_engine_profile()
+    await role_permission_snapshot.warm_up()
+    await auth_service.revoked_tokens.start()
+    yield
+    await auth_service.revoked_tokens.stop()
+    await engine.dispose()
+
 
 # Create FastAPI app
 app = FastAPI(
     title="CEIT CMS API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Oversized uploads are refused before the multipart body is spooled
+setup_upload_limit(app)
+# Inside CORS and metrics, so shed requests still get CORS headers and show up in the metrics
+setup_admission(app)
 # Setup CORS middleware
 setup_cors(app)
+# Outermost, so CORS handling is included in the timings
+setup_metrics(app)
 
 # Include routers
 app.include_router(api_router, prefix="/api")
+# Uploaded images, at the paths stored in Article.image_path
+app.include_router(media.router, prefix=settings.MEDIA_URL)
 
 # Root endpoints
 @app.get("/")
 async def root():
     return {"message": "API is running"}
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of request and database metrics"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 # Migration commands:
 # alembic revision --autogenerate -m "Initial migration"
 # alembic upgrade head
@@ -0,0 +1,45 @@
+from fastapi import FastAPI
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.admission import AdmissionController, admission_controller
+from app.core.config import settings
+
+
+class AdmissionMiddleware:
+    """Holds each API request to its route class's concurrency limit and answers
+    ``503`` with ``Retry-After`` when it cannot be admitted in time, instead of
+    letting it queue for a database connection."""
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController | None = None):
+        self.app = app
+        self.controller = controller if controller is not None else admission_controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = self.controller.route_class(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        if await self.controller.admit(route_class) is not None:
+            response = JSONResponse(
+                {"detail": "Service is overloaded, retry later"},
+                status_code=503,
+                headers={"Retry-After": str(self.controller.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(route_class)
+
+
+def setup_admission(app: FastAPI):
+    if settings.ADMISSION_CONTROL_ENABLED:
+        app.add_middleware(AdmissionMiddleware)
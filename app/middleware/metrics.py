@@ -0,0 +1,58 @@
+import time
+
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import metrics
+
+
+class MetricsMiddleware:
+    """Records latency, status and DB work per route and reports them in ``Server-Timing``.
+
+    Routes are labelled by their path template (``/api/v1/articles/{article_id}``)
+    so label cardinality stays bounded; requests that match no route share one label.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = metrics.RequestStats()
+        token = metrics.current_request.set(stats)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.perf_counter() - stats.started
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.db_queries} queries", '
+                    f"pool;dur={stats.pool_wait_seconds * 1000:.1f}, "
+                    f"app;dur={elapsed * 1000:.1f}",
+                )
+            await send(message)
+
+        metrics.http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.http_requests_in_flight.dec()
+            metrics.current_request.reset(token)
+            route = scope.get("route")
+            labels = (("method", scope["method"]), ("route", getattr(route, "path", "unmatched")))
+            metrics.http_request_duration.observe(time.perf_counter() - stats.started, labels)
+            metrics.http_responses.inc(labels + (("status", str(status_code)),))
+            metrics.http_request_db_queries.observe(stats.db_queries, labels)
+            metrics.http_request_db_duration.observe(stats.db_seconds, labels)
+
+
+def setup_metrics(app: FastAPI):
+    app.add_middleware(MetricsMiddleware)
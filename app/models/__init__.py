@@ -1,4 +1,7 @@
 from .article import Article
 from .permission import Permission
 from .role import Role
-from .user import User
\ No newline at end of file
+from .user import User
+from .revoked_token import RevokedToken
+from .refresh_token import RefreshToken
+from .authz_version import AuthzVersion
@@ -1,10 +1,18 @@
-from sqlalchemy import Column, DateTime, Enum, String, ForeignKey, Text, UUID, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, DateTime, Enum, Index, String, ForeignKey, Text, UUID, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from .base import Base
 import enum
 import uuid
 
 
+# Title matches outrank body matches in search results
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(body, '')), 'B')"
+)
+
+
 class ArticleStatus(str, enum.Enum):
     DRAFT = "draft"
     PENDING = "pending"
@@ -15,7 +23,7 @@ class ArticleStatus(str, enum.Enum):
 class Article(Base):
     __tablename__ = "articles"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     author_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     title = Column(String(255), nullable=False)
     body = Column(Text, nullable=False)
@@ -26,6 +34,16 @@ class Article(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.timezone('UTC', func.now()), onupdate=func.timezone('UTC', func.now()), nullable=False)
     approved_at = Column(DateTime(timezone=True), nullable=True)
     archived_at = Column(DateTime(timezone=True), nullable=True)
+    # Maintained by Postgres; deferred so regular loads never pull it
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)))
 
     # Relationships
     author = relationship("User", back_populates="articles")
+
+
+# Listing indexes, all ending in (created_at DESC, id DESC) to match the keyset
+# pagination order in ArticleRepository.
+Index("ix_articles_created_at_id", Article.created_at.desc(), Article.id.desc())
+Index("ix_articles_status_created_at", Article.status, Article.created_at.desc(), Article.id.desc())
+Index("ix_articles_author_id_created_at", Article.author_id, Article.created_at.desc(), Article.id.desc())
+Index("ix_articles_search_vector", Article.search_vector, postgresql_using="gin")
@@ -0,0 +1,45 @@
+from sqlalchemy import BigInteger, CheckConstraint, Column, DDL, Integer, event, select
+from .base import Base
+
+
+class AuthzVersion(Base):
+    """Single-row counter bumped by triggers on every write to roles, permissions or
+    role_permissions; cached role -> permission snapshots compare against it."""
+    __tablename__ = "authz_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=1)
+
+    __table_args__ = (CheckConstraint("id = 1", name="ck_authz_version_single_row"),)
+
+
+# Current version as a scalar subquery, to be selected alongside other columns
+current_authz_version = select(AuthzVersion.version).filter(AuthzVersion.id == 1).scalar_subquery()
+
+AUTHZ_VERSIONED_TABLES = ("roles", "permissions", "role_permissions")
+
+AUTHZ_VERSION_DDL = [
+    "INSERT INTO authz_version (id, version) VALUES (1, 1) ON CONFLICT DO NOTHING",
+    """
+    CREATE OR REPLACE FUNCTION bump_authz_version() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE authz_version SET version = version + 1 WHERE id = 1;
+        RETURN NULL;
+    END
+    $$
+    """,
+    *(
+        statement
+        for table in AUTHZ_VERSIONED_TABLES
+        for statement in (
+            f"DROP TRIGGER IF EXISTS {table}_bump_authz_version ON {table}",
+            f"CREATE TRIGGER {table}_bump_authz_version "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION bump_authz_version()",
+        )
+    ),
+]
+
+# Keep metadata.create_all (used by the tests) in line with the migration
+for statement in AUTHZ_VERSION_DDL:
+    event.listen(Base.metadata, "after_create", DDL(statement).execute_if(dialect="postgresql"))
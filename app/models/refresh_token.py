@@ -0,0 +1,16 @@
+from sqlalchemy import Column, DateTime, ForeignKey, String, UUID, func
+from .base import Base
+
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+
+    # SHA-256 hex digest of the encoded JWT, never the token itself
+    token_id = Column(String(64), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+    # Shared by every token rotated from the same login
+    family_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.timezone('UTC', func.now()), nullable=False)
+    # Set when the token is rotated or its family is logged out
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, DateTime, String, func
+from .base import Base
+
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    # SHA-256 hex digest of the encoded JWT, never the token itself
+    token_id = Column(String(64), primary_key=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    # Plain now() so the column is a true timestamptz, comparable with the sync cursor
+    revoked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
@@ -1,2 +1,5 @@
 from .user import user_crud, user_repo
-from .article import article_repo
\ No newline at end of file
+from .article import article_repo
+from .revoked_token import revoked_token_repo
+from .refresh_token import refresh_token_repo
+from .role import role_repo
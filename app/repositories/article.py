@@ -1,14 +1,81 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, Select, any_, bindparam, func, literal_column, null, select, tuple_, update, delete
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.orm import selectinload
 from uuid import UUID
 
 from app.models.article import Article, ArticleStatus
+from app.models.role import Role
 from app.models.user import User
 from app.schemas.article import ArticleCreate, ArticleUpdate
 from .base import CRUDBase
 
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+# Headlines are built on raw content, so matches are delimited with private-use
+# characters; callers escape the text and only then turn these into markup
+HIGHLIGHT_START, HIGHLIGHT_STOP = "\ue000", "\ue001"
+TITLE_HEADLINE_OPTIONS = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, HighlightAll=true"
+BODY_HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords=35, MinWords=15, MaxFragments=2"
+)
+
+
+def _without_highlight_marks(column):
+    # Content cannot smuggle in its own delimiters
+    return func.translate(column, HIGHLIGHT_START + HIGHLIGHT_STOP, "")
+
+
+# Columns of ArticleResponse
+RESPONSE_COLUMNS = (
+    Article.id,
+    Article.author_id,
+    Article.title,
+    Article.body,
+    Article.image_path,
+    Article.image_alt_text,
+    Article.status,
+    Article.created_at,
+    Article.updated_at,
+    Article.approved_at,
+    Article.archived_at,
+)
+
+# Columns of ArticleWithAuthor; select joined with users
+WITH_AUTHOR_COLUMNS = (
+    Article.id,
+    Article.author_id,
+    User.first_name.label("author_first_name"),
+    User.last_name.label("author_last_name"),
+    User.email.label("author_email"),
+    Article.title,
+    Article.body,
+    Article.image_path,
+    Article.image_alt_text,
+    Article.status,
+    Article.created_at,
+    Article.updated_at,
+    Article.approved_at,
+    Article.archived_at,
+)
+
+# Columns of ArticleSummary except the excerpt; select joined with users
+SUMMARY_COLUMNS = (
+    Article.id,
+    Article.author_id,
+    Article.title,
+    Article.image_path,
+    Article.image_alt_text,
+    Article.status,
+    Article.created_at,
+    Article.updated_at,
+    Article.approved_at,
+    Article.archived_at,
+    User.first_name.label("author_first_name"),
+    User.last_name.label("author_last_name"),
+)
+
 
 class ArticleRepository(CRUDBase[Article, ArticleCreate, ArticleUpdate]):
     
@@ -21,32 +88,230 @@ class ArticleRepository(CRUDBase[Article, ArticleCreate, ArticleUpdate]):
         )
         return result.scalars().first()
     
-    async def get_all_with_author(self, db: AsyncSession) -> List[Article]:
+    async def get_updated_at(self, db: AsyncSession, article_id: UUID) -> Optional[datetime]:
         result = await db.execute(
-            select(Article)
-            .options(selectinload(Article.author))
-            .execution_options(populate_existing=False)
+            select(Article.updated_at).filter(Article.id == article_id)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def _keyset_page(
+        query: Select,
+        limit: int,
+        after: Optional[tuple[datetime, UUID]],
+        author_id: Optional[UUID]
+    ) -> Select:
+        """Order by (created_at, id) descending and seek past ``after``.
+
+        Limits to ``limit + 1`` rows so the caller can tell whether another page exists.
+        """
+        query = query.order_by(Article.created_at.desc(), Article.id.desc()).limit(limit + 1)
+        if author_id is not None:
+            query = query.filter(Article.author_id == author_id)
+        if after is not None:
+            query = query.filter(tuple_(Article.created_at, Article.id) < tuple_(*after))
+        return query
+
+    async def get_page_rows(
+        self,
+        db: AsyncSession,
+        limit: int,
+        after: Optional[tuple[datetime, UUID]] = None,
+        author_id: Optional[UUID] = None
+    ) -> List[Row]:
+        """One keyset page of ``WITH_AUTHOR_COLUMNS`` rows, without building ORM objects."""
+        query = select(*WITH_AUTHOR_COLUMNS).join(User, User.id == Article.author_id)
+        result = await db.execute(self._keyset_page(query, limit, after, author_id))
+        return result.all()
+
+    async def get_page_versions(
+        self,
+        db: AsyncSession,
+        limit: int,
+        after: Optional[tuple[datetime, UUID]] = None,
+        author_id: Optional[UUID] = None
+    ) -> List[Row]:
+        """(id, updated_at) for the rows ``get_page_rows`` would return."""
+        query = select(Article.id, Article.updated_at)
+        result = await db.execute(self._keyset_page(query, limit, after, author_id))
+        return result.all()
+
+    async def get_summary_page(
+        self,
+        db: AsyncSession,
+        limit: int,
+        after: Optional[tuple[datetime, UUID]] = None,
+        author_id: Optional[UUID] = None,
+        excerpt_length: int = 0
+    ) -> List[Row]:
+        """Like ``get_page_rows`` but never selects ``Article.body``.
+
+        Rows are ``SUMMARY_COLUMNS`` plus ``excerpt``, the first ``excerpt_length``
+        characters of the body cut in SQL, or ``None`` when ``excerpt_length`` is 0.
+        """
+        excerpt = func.left(Article.body, excerpt_length) if excerpt_length else null()
+        query = (
+            select(*SUMMARY_COLUMNS, excerpt.label("excerpt"))
+            .join(User, User.id == Article.author_id)
         )
-        return result.scalars().unique().all()
+        result = await db.execute(self._keyset_page(query, limit, after, author_id))
+        return result.all()
     
-    async def get_by_author(self, db: AsyncSession, author_id: UUID) -> List[Article]:
+    async def search(
+        self,
+        db: AsyncSession,
+        query_text: str,
+        limit: int,
+        offset: int = 0,
+        status: Optional[ArticleStatus] = None
+    ) -> List[Row]:
+        """Ranked full-text search over title and body.
+
+        Matching, ranking and limiting happen on ``search_vector`` first; headlines
+        (the expensive part) are only computed for the rows that are returned.
+        """
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query_text)
+        rank = func.ts_rank_cd(Article.search_vector, ts_query)
+        top = (
+            select(Article.id, rank.label("rank"))
+            .filter(Article.search_vector.op("@@")(ts_query))
+            .order_by(rank.desc(), Article.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        if status is not None:
+            top = top.filter(Article.status == status)
+        top = top.subquery()
+
         result = await db.execute(
-            select(Article)
-            .filter(Article.author_id == author_id)
-            .options(selectinload(Article.author))
-            .execution_options(populate_existing=False)
+            select(
+                Article.id,
+                Article.author_id,
+                Article.title,
+                Article.status,
+                Article.created_at,
+                Article.updated_at,
+                User.first_name.label("author_first_name"),
+                User.last_name.label("author_last_name"),
+                top.c.rank,
+                func.ts_headline(
+                    SEARCH_CONFIG, _without_highlight_marks(Article.title), ts_query, TITLE_HEADLINE_OPTIONS
+                ).label("title_highlight"),
+                func.ts_headline(
+                    SEARCH_CONFIG, _without_highlight_marks(Article.body), ts_query, BODY_HEADLINE_OPTIONS
+                ).label("snippet"),
+            )
+            .join(top, top.c.id == Article.id)
+            .join(User, User.id == Article.author_id)
+            .order_by(top.c.rank.desc(), Article.id)
         )
-        return result.scalars().unique().all()
-    
-    async def get_by_status(self, db: AsyncSession, status: ArticleStatus) -> List[Article]:
+        return result.all()
+
+    async def stream_for_export(
+        self,
+        db: AsyncSession,
+        batch_size: int,
+        status: Optional[ArticleStatus] = None,
+        author_id: Optional[UUID] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> AsyncIterator[List[Row]]:
+        """Yield ``WITH_AUTHOR_COLUMNS`` rows oldest first, ``batch_size`` at a time, from a
+        server-side cursor so only one batch is held in memory."""
+        query = (
+            select(*WITH_AUTHOR_COLUMNS)
+            .join(User, User.id == Article.author_id)
+            .order_by(Article.created_at, Article.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if status is not None:
+            query = query.filter(Article.status == status)
+        if author_id is not None:
+            query = query.filter(Article.author_id == author_id)
+        if created_from is not None:
+            query = query.filter(Article.created_at >= created_from)
+        if created_to is not None:
+            query = query.filter(Article.created_at < created_to)
+
+        result = await db.stream(query)
+        async for partition in result.partitions():
+            yield partition
+
+    @staticmethod
+    def _authored_by_roles(author_role_names: List[str]):
+        return Article.author_id.in_(
+            select(User.id).join(Role, Role.id == User.role_id).filter(Role.name.in_(author_role_names))
+        )
+
+    @staticmethod
+    def _target_query(article_id: UUID):
+        return (
+            select(Article.id, Role.name.label("role_name"))
+            .join(User, User.id == Article.author_id)
+            .outerjoin(Role, Role.id == User.role_id)
+            .filter(Article.id == article_id)
+        )
+
+    @classmethod
+    def _target(cls, article_id: UUID):
+        """CTE with the article id and its author's role name, read before any change."""
+        return cls._target_query(article_id).cte("target")
+
+    async def get_write_target(self, db: AsyncSession, article_id: UUID) -> Optional[Row]:
+        """The article id and its author's ``role_name``, or ``None`` if it does not exist."""
+        result = await db.execute(self._target_query(article_id))
+        return result.first()
+
+    async def bulk_transition(
+        self,
+        db: AsyncSession,
+        article_ids: List[UUID],
+        from_statuses: List[ArticleStatus],
+        to_status: ArticleStatus,
+        stamp_column: str,
+        author_role_names: Optional[List[str]] = None
+    ) -> List[Row]:
+        """Move every listed article in ``from_statuses`` to ``to_status`` in one statement.
+
+        Sets ``stamp_column`` (``approved_at``/``archived_at``) and ``updated_at`` to now.
+        ``author_role_names`` limits the update to articles whose author has one of those
+        roles; ``None`` means unrestricted. Returns one row per existing id with its
+        previous ``status``, the author's ``role_name`` and whether it was ``updated``.
+        """
+        ids = bindparam("article_ids", article_ids, type_=ARRAY(PG_UUID(as_uuid=True)))
+        now = func.timezone('UTC', func.now())
+
+        target = (
+            select(Article.id, Article.status, Role.name.label("role_name"))
+            .join(User, User.id == Article.author_id)
+            .outerjoin(Role, Role.id == User.role_id)
+            .filter(Article.id == any_(ids))
+            .cte("target")
+        )
+
+        changed = (
+            update(Article)
+            .filter(Article.id == any_(ids), Article.status.in_(from_statuses))
+            .values({"status": to_status, stamp_column: now, "updated_at": now})
+            .returning(Article.id)
+        )
+        if author_role_names is not None:
+            changed = changed.filter(self._authored_by_roles(author_role_names))
+        changed = changed.cte("changed")
+
         result = await db.execute(
-            select(Article)
-            .filter(Article.status == status)
-            .options(selectinload(Article.author))
-            .execution_options(populate_existing=False)
+            select(
+                target.c.id,
+                target.c.status,
+                target.c.role_name,
+                changed.c.id.is_not(None).label("updated")
+            )
+            .outerjoin(changed, changed.c.id == target.c.id)
         )
-        return result.scalars().unique().all()
-    
+        rows = result.all()
+        await db.commit()
+        return rows
+
     async def create_article(
         self, 
         db: AsyncSession, 
@@ -60,38 +325,73 @@ class ArticleRepository(CRUDBase[Article, ArticleCreate, ArticleUpdate]):
         await db.commit()
         await db.refresh(db_article)
         return db_article
-    
-    async def update_article(
-        self, 
-        db: AsyncSession, 
-        article_id: UUID, 
-        article_in: ArticleUpdate
-    ) -> Optional[Article]:
+
+    async def update_article_checked(
+        self,
+        db: AsyncSession,
+        article_id: UUID,
+        article_in: ArticleUpdate,
+        author_role_names: Optional[List[str]] = None
+    ) -> Optional[Row]:
+        """Update an article in one round trip, only if its author has one of
+        ``author_role_names`` (``None`` means unrestricted).
+
+        Returns ``None`` if the article does not exist. Otherwise returns a row with
+        ``role_name`` (the author's role) and the updated article columns, which are
+        all ``None`` when the role check rejected the update.
+        """
+        update_data = article_in.model_dump(exclude_unset=True)
+        if update_data:
+            update_data["updated_at"] = func.timezone('UTC', func.now())
+        else:
+            update_data["updated_at"] = Article.updated_at
+
+        target = self._target(article_id)
+        changed = (
+            update(Article)
+            .filter(Article.id == article_id)
+            .values(update_data)
+            .returning(*RESPONSE_COLUMNS)
+        )
+        if author_role_names is not None:
+            changed = changed.filter(self._authored_by_roles(author_role_names))
+        changed = changed.cte("changed")
+
         result = await db.execute(
-            select(Article).filter(Article.id == article_id)
+            select(target.c.role_name, *changed.c)
+            .select_from(target)
+            .outerjoin(changed, changed.c.id == target.c.id)
         )
-        article = result.scalars().first()
-        if not article:
-            return None
-        
-        update_data = article_in.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(article, field, value)
-        
-        db.add(article)
+        row = result.first()
         await db.commit()
-        await db.refresh(article)
-        return article
-    
-    async def delete_article(self, db: AsyncSession, article_id: UUID) -> Optional[Article]:
+        return row
+
+    async def delete_article_checked(
+        self,
+        db: AsyncSession,
+        article_id: UUID,
+        author_role_names: Optional[List[str]] = None
+    ) -> Optional[Row]:
+        """Delete counterpart of ``update_article_checked``; the row's ``id`` is
+        ``None`` when the role check rejected the delete."""
+        target = self._target(article_id)
+        removed = (
+            delete(Article)
+            .filter(Article.id == article_id)
+            .returning(Article.id)
+        )
+        if author_role_names is not None:
+            removed = removed.filter(self._authored_by_roles(author_role_names))
+        removed = removed.cte("removed")
+
         result = await db.execute(
-            select(Article).filter(Article.id == article_id)
+            select(target.c.role_name, removed.c.id)
+            .select_from(target)
+            .outerjoin(removed, removed.c.id == target.c.id)
         )
-        article = result.scalars().first()
-        if article:
-            await db.delete(article)
-            await db.commit()
-        return article
+        row = result.first()
+        await db.commit()
+        return row
 
 
 article_repo = ArticleRepository(Article)
@@ -0,0 +1,95 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Row, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.models import RefreshToken
+from .base import CRUDBase
+
+
+class RefreshTokenRepository(CRUDBase[RefreshToken, None, None]):
+
+    async def get_by_token_id(self, db: AsyncSession, token_id: str) -> Optional[RefreshToken]:
+        result = await db.execute(
+            select(RefreshToken).filter(RefreshToken.token_id == token_id)
+        )
+        return result.scalars().first()
+
+    async def create_token(
+        self,
+        db: AsyncSession,
+        token_id: str,
+        user_id: UUID,
+        family_id: UUID,
+        expires_at: datetime
+    ) -> None:
+        db.add(RefreshToken(token_id=token_id, user_id=user_id, family_id=family_id, expires_at=expires_at))
+        await db.commit()
+
+    async def rotate(
+        self,
+        db: AsyncSession,
+        token_id: str,
+        new_token_id: str,
+        new_expires_at: datetime
+    ) -> Optional[Row]:
+        """Consume a live token and store its successor in the same family.
+
+        The consuming UPDATE is the validation: it matches only an unrevoked,
+        unexpired row, so concurrent refreshes with one token succeed at most once.
+        Returns ``(user_id, family_id)`` or ``None`` if the token was not live.
+        """
+        now = func.timezone('UTC', func.now())
+        result = await db.execute(
+            update(RefreshToken)
+            .filter(
+                RefreshToken.token_id == token_id,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now
+            )
+            .values(revoked_at=now)
+            .returning(RefreshToken.user_id, RefreshToken.family_id)
+        )
+        row = result.first()
+        if row is None:
+            await db.rollback()
+            return None
+
+        db.add(RefreshToken(
+            token_id=new_token_id,
+            user_id=row.user_id,
+            family_id=row.family_id,
+            expires_at=new_expires_at
+        ))
+        await db.commit()
+        return row
+
+    async def revoke_family(self, db: AsyncSession, family_id: UUID) -> None:
+        await db.execute(
+            update(RefreshToken)
+            .filter(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=func.timezone('UTC', func.now()))
+        )
+        await db.commit()
+
+    async def delete_expired(self, db: AsyncSession, now: datetime, batch_size: int = 5000) -> int:
+        """Delete expired rows in batches of ``batch_size``, committing after each."""
+        deleted = 0
+        while True:
+            expired = (
+                select(RefreshToken.token_id)
+                .filter(RefreshToken.expires_at <= now)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await db.execute(
+                delete(RefreshToken).filter(RefreshToken.token_id.in_(expired))
+            )
+            await db.commit()
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                return deleted
+
+
+refresh_token_repo = RefreshTokenRepository(RefreshToken)
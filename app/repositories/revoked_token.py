@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import Row, delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import RevokedToken
+from .base import CRUDBase
+
+
+class RevokedTokenRepository(CRUDBase[RevokedToken, None, None]):
+
+    async def add(self, db: AsyncSession, token_id: str, expires_at: datetime) -> None:
+        await db.execute(
+            insert(RevokedToken)
+            .values(token_id=token_id, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.token_id])
+        )
+        await db.commit()
+
+    async def get_active(
+        self,
+        db: AsyncSession,
+        now: datetime,
+        revoked_since: Optional[datetime] = None
+    ) -> List[Row]:
+        query = select(
+            RevokedToken.token_id, RevokedToken.expires_at, RevokedToken.revoked_at
+        ).filter(RevokedToken.expires_at > now)
+        if revoked_since is not None:
+            query = query.filter(RevokedToken.revoked_at >= revoked_since)
+        result = await db.execute(query)
+        return result.all()
+
+    async def delete_expired(self, db: AsyncSession, now: datetime) -> int:
+        result = await db.execute(
+            delete(RevokedToken).filter(RevokedToken.expires_at <= now)
+        )
+        await db.commit()
+        return result.rowcount
+
+
+revoked_token_repo = RevokedTokenRepository(RevokedToken)
@@ -0,0 +1,35 @@
+from typing import List
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Permission, Role
+from app.models.authz_version import current_authz_version
+from app.models.role import role_permissions
+from .base import CRUDBase
+
+
+class RoleRepository(CRUDBase[Role, None, None]):
+
+    async def get_permission_map(self, db: AsyncSession) -> List[Row]:
+        """One ``(id, name, permission_name, version)`` row per role permission.
+
+        Roles without permissions appear once with ``permission_name`` None. The
+        authz version is read by the same statement, so it matches the rows.
+        """
+        result = await db.execute(
+            select(
+                Role.id,
+                Role.name,
+                Permission.name.label("permission_name"),
+                current_authz_version.label("version"),
+            )
+            .outerjoin(role_permissions, role_permissions.c.role_id == Role.id)
+            .outerjoin(Permission, Permission.id == role_permissions.c.permission_id)
+        )
+        return result.all()
+
+    async def get_authz_version(self, db: AsyncSession) -> int:
+        return (await db.execute(select(current_authz_version))).scalar_one()
+
+
+role_repo = RoleRepository(Role)
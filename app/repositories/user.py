@@ -1,8 +1,9 @@
 from typing import Optional
 from .base import CRUDBase
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import User, Role
+from app.models.authz_version import current_authz_version
 from sqlalchemy.orm import selectinload
 from uuid import UUID
 
@@ -28,6 +29,24 @@ class CRUDUser(CRUDBase[User, None, None]):
         )
         return result.scalars().first()
 
+    async def get_by_email_for_auth(self, db: AsyncSession, email: str) -> Optional[Row]:
+        """``(User, authz_version)`` without loading the role; see RolePermissionSnapshot."""
+        result = await db.execute(
+            select(self.model, current_authz_version.label("authz_version"))
+            .filter(User.email == email)
+            .execution_options(populate_existing=False)
+        )
+        return result.first()
+
+    async def get_by_id_for_auth(self, db: AsyncSession, user_id: UUID) -> Optional[Row]:
+        """``(User, authz_version)`` without loading the role; see RolePermissionSnapshot."""
+        result = await db.execute(
+            select(self.model, current_authz_version.label("authz_version"))
+            .filter(User.id == user_id)
+            .execution_options(populate_existing=False)
+        )
+        return result.first()
+
 
 user_crud = CRUDUser(User)
 user_repo = user_crud
\ No newline at end of file
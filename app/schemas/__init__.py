@@ -1,2 +1,3 @@
 from .auth import TokenData, Token, RefreshTokenRequest
-from .article import ArticleCreate, ArticleUpdate, ArticleResponse, ArticleWithAuthor
\ No newline at end of file
+from .article import ArticleCreate, ArticleUpdate, ArticleResponse, ArticleWithAuthor, ArticlePage, ArticleSummary, ArticleSummaryPage, ArticleSearchResult, ArticleSearchPage
+from .article import ArticleBulkStatusRequest, ArticleBulkStatusResult, ArticleBulkStatusResponse
\ No newline at end of file
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 from app.models.article import ArticleStatus
 
 
@@ -44,3 +44,66 @@ class ArticleWithAuthor(ArticleResponse):
 
     class Config:
         from_attributes = True
+
+
+class ArticlePage(BaseModel):
+    items: List[ArticleWithAuthor]
+    next_cursor: Optional[str] = None
+
+
+class ArticleSummary(BaseModel):
+    id: UUID
+    author_id: UUID
+    title: str
+    image_path: Optional[str] = None
+    image_alt_text: Optional[str] = None
+    status: ArticleStatus
+    created_at: datetime
+    updated_at: datetime
+    approved_at: Optional[datetime] = None
+    archived_at: Optional[datetime] = None
+    author_first_name: str
+    author_last_name: str
+    excerpt: Optional[str] = None
+
+
+class ArticleSummaryPage(BaseModel):
+    items: List[ArticleSummary]
+    next_cursor: Optional[str] = None
+
+
+class ArticleSearchResult(BaseModel):
+    id: UUID
+    author_id: UUID
+    title: str
+    status: ArticleStatus
+    created_at: datetime
+    updated_at: datetime
+    author_first_name: str
+    author_last_name: str
+    rank: float
+    title_highlight: str
+    snippet: str
+
+    class Config:
+        from_attributes = True
+
+
+class ArticleSearchPage(BaseModel):
+    items: List[ArticleSearchResult]
+    next_offset: Optional[int] = None
+
+
+class ArticleBulkStatusRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=500)
+
+
+class ArticleBulkStatusResult(BaseModel):
+    id: UUID
+    outcome: Literal["updated", "not_found", "forbidden", "invalid_status"]
+    status: Optional[ArticleStatus] = None
+
+
+class ArticleBulkStatusResponse(BaseModel):
+    updated: int
+    results: List[ArticleBulkStatusResult]
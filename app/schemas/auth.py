@@ -7,7 +7,7 @@ class TokenData(BaseModel):
     first_name: str
     last_name: str
     role_name: str
-    permissions: list[str]
+    permissions: frozenset[str]
 
 
 class Token(BaseModel):
@@ -1,2 +1,3 @@
 from .auth_service import auth_service
-from . import article_service
\ No newline at end of file
+from . import article_service
+from . import image_service
@@ -1,12 +1,48 @@
-from typing import List
+import csv
+import html
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Literal, Optional, Sequence
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from fastapi import HTTPException, status
+from fastapi import HTTPException, UploadFile, status
 
+from app.models.article import Article, ArticleStatus
 from app.schemas.article import ArticleCreate, ArticleUpdate, ArticleResponse, ArticleWithAuthor
+from app.schemas.article import ArticleSearchResult, ArticleSearchPage
+from app.schemas.article import ArticleBulkStatusResult, ArticleBulkStatusResponse
 from app.api.v1.dependencies import CurrentUser
-from app.repositories.article import article_repo
-from app.core.authz import ensure_same_department_or_superadmin
+from app.repositories.article import article_repo, WITH_AUTHOR_COLUMNS, HIGHLIGHT_START, HIGHLIGHT_STOP
+from app.core.authz import ensure_same_department_or_superadmin, get_allowed_author_roles
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.cache import TTLCache, register_cache_metrics
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.services import image_service
+
+
+# Listing pages are plain dicts shaped like ArticlePage / ArticleSummaryPage,
+# ready to be encoded by FastJSONResponse without another validation pass.
+PageDict = dict[str, Any]
+
+# Serialized reads, validated against the caller's updated_at/ETag when one is
+# given so an entry written before another worker's update is never served.
+article_cache: TTLCache[ArticleWithAuthor] = TTLCache(
+    maxsize=settings.ARTICLE_CACHE_SIZE, ttl=settings.ARTICLE_CACHE_TTL_SECONDS
+)
+listing_cache: TTLCache[tuple[Optional[str], PageDict]] = TTLCache(
+    maxsize=settings.LISTING_CACHE_SIZE, ttl=settings.ARTICLE_CACHE_TTL_SECONDS
+)
+register_cache_metrics("article", article_cache)
+register_cache_metrics("listing", listing_cache)
+
+
+def invalidate_article_cache(article_id: Optional[UUID] = None) -> None:
+    if article_id is not None:
+        article_cache.invalidate(article_id)
+    listing_cache.clear()
 
 
 async def create_article(
@@ -15,17 +51,11 @@ async def create_article(
     author_id: UUID
 ) -> ArticleResponse:
     article = await article_repo.create_article(db, article_in, author_id)
+    invalidate_article_cache()
     return ArticleResponse.model_validate(article)
 
 
-async def get_article(db: AsyncSession, article_id: UUID) -> ArticleWithAuthor:
-    article = await article_repo.get_by_id(db, article_id)
-    if not article:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Article not found"
-        )
-    
+def _to_article_with_author(article: Article) -> ArticleWithAuthor:
     return ArticleWithAuthor(
         id=article.id,
         author_id=article.author_id,
@@ -44,50 +74,168 @@ async def get_article(db: AsyncSession, article_id: UUID) -> ArticleWithAuthor:
     )
 
 
-async def get_all_articles(db: AsyncSession) -> List[ArticleWithAuthor]:
-    articles = await article_repo.get_all_with_author(db)
-    return [
-        ArticleWithAuthor(
-            id=article.id,
-            author_id=article.author_id,
-            title=article.title,
-            body=article.body,
-            image_path=article.image_path,
-            image_alt_text=article.image_alt_text,
-            status=article.status,
-            created_at=article.created_at,
-            updated_at=article.updated_at,
-            approved_at=article.approved_at,
-            archived_at=article.archived_at,
-            author_first_name=article.author.first_name,
-            author_last_name=article.author.last_name,
-            author_email=article.author.email
+def _to_page(rows: Sequence[Row], limit: int) -> PageDict:
+    """Map ``limit + 1`` keyset rows to a page dict; column labels are the field names."""
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+
+    return {"items": [row._asdict() for row in rows], "next_cursor": next_cursor}
+
+
+async def _get_article_page(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[str],
+    author_id: Optional[UUID] = None
+) -> PageDict:
+    after = decode_cursor(cursor) if cursor else None
+    rows = await article_repo.get_page_rows(db, limit=limit, after=after, author_id=author_id)
+    return _to_page(rows, limit)
+
+
+async def get_article_summaries(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[str] = None,
+    author_id: Optional[UUID] = None,
+    excerpt_length: int = 0,
+    version: Optional[str] = None
+) -> PageDict:
+    cache_key = ("summary", limit, cursor, excerpt_length)
+    if author_id is None:
+        cached = listing_cache.get(cache_key)
+        if cached is not None and (version is None or cached[0] == version):
+            return cached[1]
+
+    after = decode_cursor(cursor) if cursor else None
+    rows = await article_repo.get_summary_page(
+        db, limit=limit, after=after, author_id=author_id, excerpt_length=excerpt_length
+    )
+
+    page = _to_page(rows, limit)
+    if author_id is None:
+        listing_cache.set(cache_key, (version, page))
+    return page
+
+
+def _highlight_html(headline: str) -> str:
+    """Escape a ts_headline result, then mark its matches with ``<mark>`` tags."""
+    escaped = html.escape(headline)
+    return escaped.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_STOP, "</mark>")
+
+
+def _to_search_result(row: Row) -> ArticleSearchResult:
+    result = row._asdict()
+    result["title_highlight"] = _highlight_html(row.title_highlight)
+    result["snippet"] = _highlight_html(row.snippet)
+    return ArticleSearchResult.model_validate(result)
+
+
+async def search_articles(
+    db: AsyncSession,
+    query_text: str,
+    limit: int,
+    offset: int = 0,
+    status: Optional[ArticleStatus] = None
+) -> ArticleSearchPage:
+    # Results are capped at SEARCH_MAX_RESULTS however far the client pages
+    limit = min(limit, settings.SEARCH_MAX_RESULTS - offset)
+    if limit <= 0:
+        return ArticleSearchPage(items=[])
+
+    rows = await article_repo.search(db, query_text, limit=limit + 1, offset=offset, status=status)
+
+    next_offset = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if offset + limit < settings.SEARCH_MAX_RESULTS:
+            next_offset = offset + limit
+
+    return ArticleSearchPage(
+        items=[_to_search_result(row) for row in rows],
+        next_offset=next_offset
+    )
+
+
+async def get_article_version(db: AsyncSession, article_id: UUID) -> datetime:
+    updated_at = await article_repo.get_updated_at(db, article_id)
+    if updated_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Article not found"
         )
-        for article in articles
-    ]
-
-
-async def get_my_articles(db: AsyncSession, author_id: UUID) -> List[ArticleWithAuthor]:
-    articles = await article_repo.get_by_author(db, author_id)
-    return [
-        ArticleWithAuthor(
-            id=article.id,
-            author_id=article.author_id,
-            title=article.title,
-            body=article.body,
-            image_path=article.image_path,
-            image_alt_text=article.image_alt_text,
-            status=article.status,
-            created_at=article.created_at,
-            updated_at=article.updated_at,
-            approved_at=article.approved_at,
-            archived_at=article.archived_at,
-            author_first_name=article.author.first_name,
-            author_last_name=article.author.last_name,
-            author_email=article.author.email
+    return updated_at
+
+
+async def get_article_page_version(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[str] = None,
+    author_id: Optional[UUID] = None
+) -> list[tuple[UUID, datetime]]:
+    after = decode_cursor(cursor) if cursor else None
+    rows = await article_repo.get_page_versions(db, limit=limit, after=after, author_id=author_id)
+    return [(row.id, row.updated_at) for row in rows]
+
+
+async def get_article(
+    db: AsyncSession,
+    article_id: UUID,
+    updated_at: Optional[datetime] = None
+) -> ArticleWithAuthor:
+    cached = article_cache.get(article_id)
+    if cached is not None and (updated_at is None or cached.updated_at == updated_at):
+        return cached
+
+    article = await article_repo.get_by_id(db, article_id)
+    if not article:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Article not found"
         )
-        for article in articles
-    ]
+    
+    result = _to_article_with_author(article)
+    article_cache.set(article_id, result)
+    return result
+
+
+async def get_all_articles(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[str] = None,
+    version: Optional[str] = None
+) -> PageDict:
+    cache_key = ("full", limit, cursor)
+    cached = listing_cache.get(cache_key)
+    if cached is not None and (version is None or cached[0] == version):
+        return cached[1]
+
+    page = await _get_article_page(db, limit=limit, cursor=cursor)
+    listing_cache.set(cache_key, (version, page))
+    return page
+
+
+async def get_my_articles(
+    db: AsyncSession,
+    author_id: UUID,
+    limit: int,
+    cursor: Optional[str] = None
+) -> PageDict:
+    return await _get_article_page(db, limit=limit, cursor=cursor, author_id=author_id)
+
+
+def _raise_write_rejected(current_user: CurrentUser, target_role_name: Optional[str]) -> None:
+    """The article exists but the guarded write did not touch it; never falls through."""
+    ensure_same_department_or_superadmin(current_user, target_role_name)
+    # The department check passes now, so the author's role changed (or the article
+    # went away) between the guard and the write
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Article changed while being modified, please retry"
+    )
 
 
 async def update_article(
@@ -96,32 +244,159 @@ async def update_article(
     article_in: ArticleUpdate,
     current_user: CurrentUser
 ) -> ArticleResponse:
-    # Check if article exists
-    existing_article = await article_repo.get_by_id(db, article_id)
-    if not existing_article:
+    # Existence, department check and update happen in a single statement
+    row = await article_repo.update_article_checked(
+        db, article_id, article_in, author_role_names=get_allowed_author_roles(current_user)
+    )
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found"
         )
+    if row.id is None:
+        _raise_write_rejected(current_user, row.role_name)
     
-    author_role_name = existing_article.author.role.name if existing_article.author and existing_article.author.role else None
-    ensure_same_department_or_superadmin(current_user, author_role_name)
-    
-    article = await article_repo.update_article(db, article_id, article_in)
-    return ArticleResponse.model_validate(article)
+    invalidate_article_cache(article_id)
+    return ArticleResponse.model_validate(row)
+
+
+async def set_article_image(
+    db: AsyncSession,
+    article_id: UUID,
+    upload: UploadFile,
+    alt_text: str,
+    current_user: CurrentUser
+) -> ArticleResponse:
+    # Checked before anything is written, so a request that is bound to be rejected
+    # stores no file and queues no resize job
+    target = await article_repo.get_write_target(db, article_id)
+    if target is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Article not found"
+        )
+    ensure_same_department_or_superadmin(current_user, target.role_name)
+
+    # The update below repeats the check atomically. Storage is content-addressed,
+    # so a file kept after a rejection in between is reused by the next upload of it
+    image_path = await image_service.store_image(upload)
+    article_in = ArticleUpdate(image_path=image_path, image_alt_text=alt_text)
+    return await update_article(db, article_id, article_in, current_user)
 
 
 async def delete_article(db: AsyncSession, article_id: UUID, current_user: CurrentUser) -> dict:
-    # Check if article exists
-    existing_article = await article_repo.get_by_id(db, article_id)
-    if not existing_article:
+    # Existence, department check and delete happen in a single statement
+    row = await article_repo.delete_article_checked(
+        db, article_id, author_role_names=get_allowed_author_roles(current_user)
+    )
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found"
         )
+    if row.id is None:
+        _raise_write_rejected(current_user, row.role_name)
     
-    author_role_name = existing_article.author.role.name if existing_article.author and existing_article.author.role else None
-    ensure_same_department_or_superadmin(current_user=current_user, target_role_name=author_role_name)
-    
-    await article_repo.delete_article(db, article_id)
+    invalidate_article_cache(article_id)
     return {"message": "Article deleted successfully"}
+
+
+# Allowed source statuses and the timestamp column set for each bulk transition
+BULK_TRANSITIONS = {
+    ArticleStatus.APPROVED: ([ArticleStatus.PENDING], "approved_at"),
+    ArticleStatus.ARCHIVED: ([ArticleStatus.DRAFT, ArticleStatus.PENDING, ArticleStatus.APPROVED], "archived_at"),
+}
+
+
+async def bulk_transition_status(
+    db: AsyncSession,
+    article_ids: list[UUID],
+    to_status: ArticleStatus,
+    current_user: CurrentUser
+) -> ArticleBulkStatusResponse:
+    article_ids = list(dict.fromkeys(article_ids))
+    from_statuses, stamp_column = BULK_TRANSITIONS[to_status]
+
+    author_role_names = get_allowed_author_roles(current_user)
+
+    rows = await article_repo.bulk_transition(
+        db,
+        article_ids,
+        from_statuses=from_statuses,
+        to_status=to_status,
+        stamp_column=stamp_column,
+        author_role_names=author_role_names
+    )
+    found = {row.id: row for row in rows}
+
+    results = []
+    for article_id in article_ids:
+        row = found.get(article_id)
+        if row is None:
+            results.append(ArticleBulkStatusResult(id=article_id, outcome="not_found"))
+        elif row.updated:
+            results.append(ArticleBulkStatusResult(id=article_id, outcome="updated", status=to_status))
+            article_cache.invalidate(article_id)
+        elif author_role_names is not None and row.role_name not in author_role_names:
+            results.append(ArticleBulkStatusResult(id=article_id, outcome="forbidden", status=row.status))
+        else:
+            results.append(ArticleBulkStatusResult(id=article_id, outcome="invalid_status", status=row.status))
+
+    updated = sum(1 for result in results if result.outcome == "updated")
+    if updated:
+        listing_cache.clear()
+    return ArticleBulkStatusResponse(updated=updated, results=results)
+
+
+EXPORT_FIELDS = [column.key for column in WITH_AUTHOR_COLUMNS]
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, ArticleStatus):
+        return value.value
+    if value is None:
+        return None
+    return str(value) if isinstance(value, UUID) else value
+
+
+async def export_articles(
+    export_format: Literal["ndjson", "csv"],
+    status: Optional[ArticleStatus] = None,
+    author_id: Optional[UUID] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None
+) -> AsyncIterator[bytes]:
+    """Encoded export chunks, one per fetched batch.
+
+    Opens its own session: the response body is produced after the request's
+    ``get_db`` session has already been closed.
+    """
+    if export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        yield buffer.getvalue().encode()
+
+    async with AsyncSessionLocal() as db:
+        batches = article_repo.stream_for_export(
+            db,
+            batch_size=settings.EXPORT_BATCH_SIZE,
+            status=status,
+            author_id=author_id,
+            created_from=created_from,
+            created_to=created_to
+        )
+        async for rows in batches:
+            if export_format == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerows(
+                    ["" if value is None else _export_value(value) for value in row] for row in rows
+                )
+                yield buffer.getvalue().encode()
+            else:
+                yield "".join(
+                    json.dumps(dict(zip(EXPORT_FIELDS, map(_export_value, row)))) + "\n" for row in rows
+                ).encode()
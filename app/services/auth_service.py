@@ -1,70 +1,84 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
-from app.core.security import verify_password, create_access_token
+from app.core.security import verify_password, create_access_token, get_token_id, get_token_expiry
 from datetime import timedelta, datetime, timezone
 from app.core.config import settings
 from app.models import User
 from app.schemas import Token, TokenData
-from app.repositories import user_repo
+from app.repositories import user_repo, refresh_token_repo
 from jose import jwt, JWTError
-from uuid import UUID
+from uuid import UUID, uuid4
+from .token_revocation import RevocationStore, create_revocation_store
+from .role_permissions import RolePermissionSnapshot, role_permission_snapshot
 
 class AuthService:
 
-    def __init__(self):
-        self.revoked_access_tokens: set[str] = set()
-        self.revoked_refresh_tokens: set[str] = set()
-        self.valid_refresh_tokens: dict[str, str] = {}
+    def __init__(
+        self,
+        revocation_store: RevocationStore | None = None,
+        role_permissions: RolePermissionSnapshot | None = None
+    ):
+        # Revoked access tokens; refresh tokens are tracked in the refresh_tokens table
+        self.revoked_tokens = revocation_store if revocation_store is not None else create_revocation_store()
+        self.role_permissions = role_permissions if role_permissions is not None else role_permission_snapshot
     
     async def authenticate_user(self, db: AsyncSession, email: str, password: str) -> Token:
         
-        user_in_db = await user_repo.get_by_email(db=db, email=email)
+        row = await user_repo.get_by_email_for_auth(db=db, email=email)
         
-        if not user_in_db or not verify_password(plain_password=password, hashed_password=user_in_db.hashed_password):
+        if not row or not await verify_password(plain_password=password, hashed_password=row.User.hashed_password):
             raise HTTPException(
                         status_code=status.HTTP_401_UNAUTHORIZED,
                         detail="Invalid credentials",
                         headers={"WWW-Authenticate": "Bearer"},
                     )
         
-        return await self._create_token_pair(user_in_db)
+        return await self._create_token_pair(db, row.User, row.authz_version)
 
 
-    async def _create_access_token(self, user: User) -> str:
+    async def _create_access_token(self, db: AsyncSession, user: User, authz_version: int) -> str:
+        # Role and permissions come from the in-process snapshot, not a join per login
+        grant = await self.role_permissions.get(db, user.role_id, authz_version)
+        if grant is None:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User has no role assigned")
+
         claims = TokenData(
             sub=user.id,
             first_name=user.first_name,
             last_name=user.last_name,
-            role_name=user.role.name,
-            permissions=[perm.name for perm in user.role.permissions]
+            role_name=grant.name,
+            permissions=frozenset(grant.permissions)
         )
 
         access_token_expires = timedelta(days=settings.ACCESS_TOKEN_EXPIRE_DAYS)
         return create_access_token(data=claims, expires_delta=access_token_expires)
 
-    def _create_refresh_token(self, user: User) -> str:
+    def _encode_refresh_token(self, user_id: UUID, family_id: UUID) -> tuple[str, datetime]:
         expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
         payload = {
-            "sub": str(user.id),
+            "sub": str(user_id),
             "type": "refresh",
+            "fam": str(family_id),
+            "jti": uuid4().hex,
             "exp": int(expire.timestamp())
         }
         token = jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-        self.valid_refresh_tokens[token] = str(user.id)
+        return token, expire
+
+    async def _create_refresh_token(self, db: AsyncSession, user: User) -> str:
+        family_id = uuid4()
+        token, expire = self._encode_refresh_token(user.id, family_id)
+        await refresh_token_repo.create_token(
+            db, token_id=get_token_id(token), user_id=user.id, family_id=family_id, expires_at=expire
+        )
         return token
 
-    async def _create_token_pair(self, user: User) -> Token:
-        access_token = await self._create_access_token(user)
-        refresh_token = self._create_refresh_token(user)
+    async def _create_token_pair(self, db: AsyncSession, user: User, authz_version: int) -> Token:
+        access_token = await self._create_access_token(db, user, authz_version)
+        refresh_token = await self._create_refresh_token(db, user)
         return Token(access_token=access_token, token_type="bearer", refresh_token=refresh_token)
 
     async def refresh_access_token(self, db: AsyncSession, refresh_token: str) -> Token:
-        if refresh_token in self.revoked_refresh_tokens:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revoked")
-
-        if refresh_token not in self.valid_refresh_tokens:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
-
         try:
             payload = jwt.decode(refresh_token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         except JWTError:
@@ -74,29 +88,47 @@ class AuthService:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
 
         user_id = payload.get("sub")
-        if not user_id:
+        family_id = payload.get("fam")
+        if not user_id or not family_id:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+
+        token_id = get_token_id(refresh_token)
+        new_refresh_token, new_expire = self._encode_refresh_token(UUID(user_id), UUID(family_id))
+        rotated = await refresh_token_repo.rotate(
+            db, token_id=token_id, new_token_id=get_token_id(new_refresh_token), new_expires_at=new_expire
+        )
+        if rotated is None:
+            stored = await refresh_token_repo.get_by_token_id(db, token_id)
+            if stored is not None and stored.revoked_at is not None:
+                # A rotated token was presented again: assume it leaked and end the whole session
+                await refresh_token_repo.revoke_family(db, stored.family_id)
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revoked")
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
-        user = await user_repo.get_by_id(db=db, user_id=UUID(user_id))
-        if not user:
+        row = await user_repo.get_by_id_for_auth(db=db, user_id=rotated.user_id)
+        if not row:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
-        self.valid_refresh_tokens.pop(refresh_token, None)
-        self.revoked_refresh_tokens.add(refresh_token)
+        access_token = await self._create_access_token(db, row.User, row.authz_version)
+        return Token(access_token=access_token, token_type="bearer", refresh_token=new_refresh_token)
 
-        return await self._create_token_pair(user)
+    async def revoke_access_token(self, access_token: str) -> None:
+        expires_at = get_token_expiry(access_token, default=timedelta(days=settings.ACCESS_TOKEN_EXPIRE_DAYS))
+        await self.revoked_tokens.revoke(get_token_id(access_token), expires_at)
 
-    def revoke_access_token(self, access_token: str) -> None:
-        self.revoked_access_tokens.add(access_token)
+    async def revoke_refresh_token(self, db: AsyncSession, refresh_token: str) -> None:
+        """Revoke the refresh token and every token rotated from the same login"""
+        stored = await refresh_token_repo.get_by_token_id(db, get_token_id(refresh_token))
+        if stored is not None:
+            await refresh_token_repo.revoke_family(db, stored.family_id)
 
-    def logout(self, access_token: str, refresh_token: str | None = None) -> None:
-        self.revoke_access_token(access_token)
+    async def logout(self, db: AsyncSession, access_token: str, refresh_token: str | None = None) -> None:
+        await self.revoke_access_token(access_token)
         if refresh_token:
-            self.valid_refresh_tokens.pop(refresh_token, None)
-            self.revoked_refresh_tokens.add(refresh_token)
+            await self.revoke_refresh_token(db, refresh_token)
 
-    def is_access_token_revoked(self, token: str) -> bool:
-        return token in self.revoked_access_tokens
+    async def is_access_token_revoked(self, token: str) -> bool:
+        return await self.revoked_tokens.is_revoked(get_token_id(token))
 
 
 auth_service = AuthService()
\ No newline at end of file
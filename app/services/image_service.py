@@ -0,0 +1,134 @@
+import asyncio
+import hashlib
+import mimetypes
+import os
+import re
+import stat
+import tempfile
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+
+from fastapi import HTTPException, Response, UploadFile, status
+from fastapi.responses import FileResponse
+
+from app.core.config import settings
+from app.core.http_cache import etag_matches, make_etag
+from app.core.images import image_dir, image_variant_pool, sniff_image_type, upload_tmp_dir
+
+# Content-hashed originals and their resized variants never change once written
+HASHED_NAME = re.compile(r"^[0-9a-f]{64}(_\d+w)?\.[a-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _discard(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+async def store_image(upload: UploadFile) -> str:
+    """Stream ``upload`` to disk under its SHA-256 and return the public path.
+
+    The file is read and written ``IMAGE_UPLOAD_CHUNK_SIZE`` bytes at a time with
+    disk writes off the event loop. Identical content is stored once; resized
+    variants are only scheduled the first time an image is seen.
+    """
+    directory = image_dir()
+    await asyncio.to_thread(directory.mkdir, parents=True, exist_ok=True)
+    await asyncio.to_thread(upload_tmp_dir().mkdir, parents=True, exist_ok=True)
+    fd, partial = tempfile.mkstemp(dir=upload_tmp_dir(), suffix=".part")
+
+    digest = hashlib.sha256()
+    size = 0
+    extension = None
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := await upload.read(settings.IMAGE_UPLOAD_CHUNK_SIZE):
+                if extension is None:
+                    extension = sniff_image_type(chunk)
+                    if extension is None:
+                        raise HTTPException(
+                            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                            detail="Only JPEG, PNG, GIF and WebP images are accepted"
+                        )
+                size += len(chunk)
+                if size > settings.IMAGE_UPLOAD_MAX_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Image exceeds {settings.IMAGE_UPLOAD_MAX_BYTES} bytes"
+                    )
+                digest.update(chunk)
+                await asyncio.to_thread(out.write, chunk)
+
+        if extension is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty file")
+
+        name = f"{digest.hexdigest()}.{extension}"
+        target = directory / name
+        if await asyncio.to_thread(target.exists):
+            await asyncio.to_thread(_discard, partial)
+        else:
+            await asyncio.to_thread(os.replace, partial, target)
+            image_variant_pool.submit(target)
+    except BaseException:
+        await asyncio.to_thread(_discard, partial)
+        raise
+
+    return f"{settings.MEDIA_URL}/images/{name}"
+
+
+def _stat_file(path: Path) -> Optional[os.stat_result]:
+    try:
+        stat_result = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return stat_result if stat.S_ISREG(stat_result.st_mode) else None
+
+
+def _not_modified_since(if_modified_since: Optional[str], stat_result: os.stat_result) -> bool:
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return int(stat_result.st_mtime) <= since.timestamp()
+
+
+async def image_response(
+    name: str,
+    if_none_match: Optional[str] = None,
+    if_modified_since: Optional[str] = None
+) -> Response:
+    """Response for the stored image ``name``: 304 when the client's copy is current,
+    otherwise the file with Range support.
+
+    Every accepted upload format is already compressed, so images are served as
+    stored, without a Content-Encoding.
+    """
+    path = image_dir() / name
+    stat_result = await asyncio.to_thread(_stat_file, path)
+    if stat_result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+
+    media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    headers = {"X-Content-Type-Options": "nosniff"}
+    if HASHED_NAME.match(name):
+        headers["ETag"] = f'"{name.rsplit(".", 1)[0]}"'
+        headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+    else:
+        headers["ETag"] = make_etag(name, stat_result.st_mtime_ns, stat_result.st_size)
+        headers["Cache-Control"] = f"public, max-age={settings.PUBLIC_CACHE_MAX_AGE}, must-revalidate"
+    headers["Last-Modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+
+    # If-Modified-Since is only consulted when If-None-Match is absent
+    if if_none_match is not None:
+        current = etag_matches(if_none_match, headers["ETag"])
+    else:
+        current = _not_modified_since(if_modified_since, stat_result)
+    if current:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat_result)
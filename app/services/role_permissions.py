@@ -0,0 +1,63 @@
+import asyncio
+import logging
+from typing import NamedTuple, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.repositories import role_repo
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class RoleGrant(NamedTuple):
+    name: str
+    permissions: tuple[str, ...]
+
+
+class RolePermissionSnapshot:
+    """In-process copy of every role and its permission names.
+
+    Tagged with the ``authz_version`` it was read at. Callers pass the version
+    they read alongside the user, and the snapshot reloads when that is newer,
+    so a change to roles or permissions is picked up by the next login on every
+    worker at no extra query while nothing changes.
+    """
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self._roles: dict[int, RoleGrant] = {}
+        self._lock = asyncio.Lock()
+
+    async def load(self, db: AsyncSession) -> None:
+        rows = await role_repo.get_permission_map(db)
+        roles: dict[int, tuple[str, list[str]]] = {}
+        for row in rows:
+            _, permissions = roles.setdefault(row.id, (row.name, []))
+            if row.permission_name is not None:
+                permissions.append(row.permission_name)
+
+        self._roles = {
+            role_id: RoleGrant(name, tuple(sorted(permissions)))
+            for role_id, (name, permissions) in roles.items()
+        }
+        self.version = rows[0].version if rows else await role_repo.get_authz_version(db)
+
+    async def get(self, db: AsyncSession, role_id: Optional[int], version: int) -> Optional[RoleGrant]:
+        """The grant for ``role_id`` as of at least ``version``."""
+        if self.version is None or version > self.version:
+            async with self._lock:
+                if self.version is None or version > self.version:
+                    await self.load(db)
+        return self._roles.get(role_id) if role_id is not None else None
+
+    async def warm_up(self) -> None:
+        """Load at startup so the first logins skip the reload; failures are retried lazily."""
+        try:
+            async with AsyncSessionLocal() as db:
+                await self.load(db)
+        except Exception:
+            logger.warning("Could not load role permissions at startup", exc_info=True)
+
+
+role_permission_snapshot = RolePermissionSnapshot()
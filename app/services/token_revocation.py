@@ -0,0 +1,159 @@
+import asyncio
+import heapq
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Protocol
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.repositories import revoked_token_repo
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class RevocationBackend(Protocol):
+    async def add(self, token_id: str, expires_at: datetime) -> None: ...
+
+    async def load_active(self, revoked_since: Optional[datetime]) -> list[tuple[str, datetime, datetime]]: ...
+
+    async def purge_expired(self) -> int: ...
+
+
+class InMemoryRevocationBackend:
+    """No durability; revocations live only in the owning RevocationStore."""
+
+    async def add(self, token_id: str, expires_at: datetime) -> None:
+        return None
+
+    async def load_active(self, revoked_since: Optional[datetime]) -> list[tuple[str, datetime, datetime]]:
+        return []
+
+    async def purge_expired(self) -> int:
+        return 0
+
+
+class DatabaseRevocationBackend:
+    """Persists revocations in ``revoked_tokens`` so they survive restarts and
+    reach every worker on its next sync."""
+
+    async def add(self, token_id: str, expires_at: datetime) -> None:
+        async with AsyncSessionLocal() as db:
+            await revoked_token_repo.add(db, token_id=token_id, expires_at=expires_at)
+
+    async def load_active(self, revoked_since: Optional[datetime]) -> list[tuple[str, datetime, datetime]]:
+        async with AsyncSessionLocal() as db:
+            rows = await revoked_token_repo.get_active(
+                db, now=datetime.now(timezone.utc), revoked_since=revoked_since
+            )
+        return [(row.token_id, row.expires_at, row.revoked_at) for row in rows]
+
+    async def purge_expired(self) -> int:
+        async with AsyncSessionLocal() as db:
+            return await revoked_token_repo.delete_expired(db, now=datetime.now(timezone.utc))
+
+
+class RevocationStore:
+    """Revoked token ids with their expiry.
+
+    Lookups are a dict hit. Entries are dropped once the token would have expired
+    anyway, so memory is bounded by the number of tokens revoked within one token
+    lifetime. A background task started in the lifespan pulls revocations made by
+    other workers from the backend every ``sync_interval`` seconds and purges
+    expired backend rows hourly; requests only ever read the last snapshot. After a
+    failed sync the task backs off, up to ``MAX_BACKOFF_SECONDS`` between attempts.
+    """
+
+    # Re-read window behind the newest revocation seen: revoked_at is the inserting
+    # transaction's start time, so rows can commit after a newer one was already read
+    SYNC_OVERLAP_SECONDS = 60
+    PURGE_INTERVAL_SECONDS = 3600
+    MAX_BACKOFF_SECONDS = 60
+
+    def __init__(self, backend: RevocationBackend, sync_interval: float):
+        self.backend = backend
+        self.sync_interval = sync_interval
+        self._expiry: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+        # Newest revoked_at pulled so far; on the database clock, never this worker's
+        self._revoked_through: Optional[datetime] = None
+        self._last_purge = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def _remember(self, token_id: str, expires_at: float) -> None:
+        if expires_at <= time.time() or self._expiry.get(token_id, 0) >= expires_at:
+            return
+        self._expiry[token_id] = expires_at
+        heapq.heappush(self._heap, (expires_at, token_id))
+
+    def _evict_expired(self) -> None:
+        now = time.time()
+        while self._heap and self._heap[0][0] <= now:
+            expires_at, token_id = heapq.heappop(self._heap)
+            if self._expiry.get(token_id) == expires_at:
+                del self._expiry[token_id]
+
+    async def sync(self) -> None:
+        """Pull revocations made since the last sync, and purge the backend when due."""
+        revoked_since = None
+        if self._revoked_through is not None:
+            revoked_since = self._revoked_through - timedelta(seconds=self.SYNC_OVERLAP_SECONDS)
+        started = time.time()
+
+        for token_id, expires_at, revoked_at in await self.backend.load_active(revoked_since):
+            self._remember(token_id, expires_at.timestamp())
+            if self._revoked_through is None or revoked_at > self._revoked_through:
+                self._revoked_through = revoked_at
+        if started - self._last_purge >= self.PURGE_INTERVAL_SECONDS:
+            await self.backend.purge_expired()
+            self._last_purge = started
+        self._evict_expired()
+
+    async def _run(self) -> None:
+        delay = self.sync_interval
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self.sync()
+                delay = self.sync_interval
+            except Exception:
+                delay = min(max(delay, self.sync_interval) * 2, self.MAX_BACKOFF_SECONDS)
+                logger.warning("Token revocation sync failed, retrying in %.0fs", delay, exc_info=True)
+
+    async def start(self) -> None:
+        """Load the initial snapshot and start syncing in the background."""
+        try:
+            await self.sync()
+        except Exception:
+            logger.warning("Could not load token revocations at startup", exc_info=True)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def revoke(self, token_id: str, expires_at: datetime) -> None:
+        self._remember(token_id, expires_at.timestamp())
+        await self.backend.add(token_id, expires_at)
+
+    async def is_revoked(self, token_id: str) -> bool:
+        expires_at = self._expiry.get(token_id)
+        return expires_at is not None and expires_at > time.time()
+
+
+def create_revocation_store() -> RevocationStore:
+    backend: RevocationBackend
+    if settings.TOKEN_REVOCATION_BACKEND == "database":
+        backend = DatabaseRevocationBackend()
+    else:
+        backend = InMemoryRevocationBackend()
+    return RevocationStore(backend, sync_interval=settings.TOKEN_REVOCATION_SYNC_SECONDS)
@@ -0,0 +1,69 @@
+"""Per-request cost of ``get_current_user`` with a cold versus warm
+verified-token cache.
+
+Usage:
+    python scripts/benchmarks/auth_overhead.py [--iterations 20000]
+
+"cold" clears the cache before every call, so each call decodes and verifies
+the JWT and builds ``TokenData`` as before the cache existed.
+"""
+import sys
+import asyncio
+import argparse
+import time
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[2]))
+
+import app.main  # noqa: F401  (loads modules in the order the app does)
+from app.api.v1.dependencies import get_current_token, get_current_user, verified_token_cache
+from app.core.security import create_access_token
+from app.schemas import TokenData
+from scripts.benchmarks.common import summarize, print_json
+from fastapi.security import HTTPAuthorizationCredentials
+
+
+async def authenticate(token: str) -> TokenData:
+    # Same chain FastAPI resolves for require_auth: revocation check, then claims
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    return await get_current_user(await get_current_token(credentials))
+
+
+async def measure(token: str, iterations: int, cold: bool) -> dict:
+    samples = []
+    for _ in range(iterations):
+        if cold:
+            verified_token_cache.clear()
+        started = time.perf_counter()
+        await authenticate(token)
+        samples.append(time.perf_counter() - started)
+    summary = summarize(samples)
+    summary["mean_us"] = round(sum(samples) / len(samples) * 1_000_000, 2)
+    return summary
+
+
+async def main(iterations: int) -> None:
+    token = create_access_token(TokenData(
+        sub=uuid.uuid4(),
+        first_name="Bench",
+        last_name="User",
+        role_name="super_admin",
+        permissions=["user.manage", "article.create", "article.archive", "article.approve", "article.update"],
+    ))
+    # Prime the revocation store so its first sync is not measured
+    await authenticate(token)
+
+    print_json({
+        "iterations": iterations,
+        "cold": await measure(token, iterations, cold=True),
+        "warm": await measure(token, iterations, cold=False),
+        "cache": verified_token_cache.stats(),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,90 @@
+"""Helpers shared by the benchmark scripts.
+
+Requests are driven straight through the ASGI ``app`` in-process, so results
+measure the application and not the network stack or an HTTP client.
+"""
+import json
+import time
+from typing import Any, Optional, Sequence
+
+
+async def asgi_request(
+    app,
+    method: str,
+    path: str,
+    query_string: str = "",
+    headers: Optional[dict[str, str]] = None,
+    body: bytes = b"",
+    client: tuple[str, int] = ("127.0.0.1", 50000),
+) -> tuple[int, dict[str, str], bytes]:
+    """Send one HTTP request to an ASGI app and return (status, headers, body)."""
+    raw_headers = [(b"host", b"bench")]
+    raw_headers += [(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "root_path": "",
+        "headers": raw_headers,
+        "client": client,
+        "server": ("bench", 80),
+    }
+    request_sent = False
+    response: dict[str, Any] = {"status": 0, "headers": {}, "body": b""}
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {key.decode(): value.decode() for key, value in message.get("headers", [])}
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+
+    await app(scope, receive, send)
+    return response["status"], response["headers"], response["body"]
+
+
+def percentile(samples: Sequence[float], fraction: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(samples: Sequence[float], elapsed: Optional[float] = None) -> dict[str, Optional[float]]:
+    """p50/p95/p99/max in milliseconds, plus throughput when ``elapsed`` is given."""
+    to_ms = lambda value: round(value * 1000, 3) if value is not None else None
+    summary = {
+        "count": len(samples),
+        "p50_ms": to_ms(percentile(samples, 0.50)),
+        "p95_ms": to_ms(percentile(samples, 0.95)),
+        "p99_ms": to_ms(percentile(samples, 0.99)),
+        "max_ms": to_ms(max(samples) if samples else None),
+    }
+    if elapsed:
+        summary["rps"] = round(len(samples) / elapsed, 1)
+    return summary
+
+
+def print_json(report: dict) -> None:
+    print(json.dumps(report, indent=2, default=str))
+
+
+class Timer:
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.started
@@ -0,0 +1,142 @@
+"""Responsiveness under a credential-stuffing attack on /auth/login, with the
+login throttle off and on.
+
+Usage:
+    python scripts/benchmarks/credential_stuffing.py [--attackers 4] [--concurrency 64]
+        [--duration 10] [--probe-interval 0.05]
+
+Needs the dataset from scripts/benchmarks/dataset.py in DATABASE_URL. Attackers
+send wrong passwords for the benchmark accounts from a few addresses as fast as
+they can; meanwhile, from other addresses, a probe reads the public article
+listing and a legitimate user logs in with the right password. Reports the
+probe and legitimate-login latency, the attack's status codes and how many
+argon2 verifications the attack cost.
+"""
+import sys
+import asyncio
+import argparse
+import random
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import urlencode
+
+sys.path.append(str(Path(__file__).parents[2]))
+
+from sqlalchemy import select
+
+from app.main import app
+from app.core.database import AsyncSessionLocal
+from app.core.hashing import hashing_pool
+from app.core.rate_limit import login_throttle
+from app.models import User
+from scripts.benchmarks.common import asgi_request, summarize, print_json
+from scripts.benchmarks.dataset import BENCH_EMAIL_DOMAIN, BENCH_PASSWORD
+
+LOGIN = "/api/v1/auth/login"
+LISTING = "/api/v1/articles/"
+
+
+def login_query(email: str, password: str) -> str:
+    return urlencode({"email": email, "password": password})
+
+
+async def attacker(address: str, emails: list[str], deadline: float, rng: random.Random, statuses: Counter) -> None:
+    port = 40000
+    while time.perf_counter() < deadline:
+        port += 1
+        status, _, _ = await asgi_request(
+            app, "POST", LOGIN, login_query(rng.choice(emails), "Password1!"), client=(address, port)
+        )
+        statuses[status] += 1
+
+
+async def probe(deadline: float, interval: float, samples: list[float]) -> None:
+    # Latency is measured from when each request was due, as in login_burst.py
+    due = time.perf_counter()
+    while due < deadline:
+        await asgi_request(app, "GET", LISTING, "limit=20", client=("10.1.0.1", 50000))
+        samples.append(time.perf_counter() - due)
+        due += interval
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+
+
+async def legitimate_user(email: str, deadline: float, interval: float, samples: list[float], statuses: Counter) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        status, _, _ = await asgi_request(
+            app, "POST", LOGIN, login_query(email, BENCH_PASSWORD), client=("10.2.0.1", 50000)
+        )
+        samples.append(time.perf_counter() - started)
+        statuses[status] += 1
+        await asyncio.sleep(interval)
+
+
+async def run_mode(throttled: bool, emails: list[str], args: argparse.Namespace) -> dict:
+    login_throttle.enabled = throttled
+    login_throttle.clear()
+    verifications_before = hashing_pool.completed
+    rng = random.Random(args.seed)
+    # The legitimate user is not one of the accounts under attack
+    targets, victim = emails[:-1], emails[-1]
+
+    probe_samples: list[float] = []
+    login_samples: list[float] = []
+    attack_statuses: Counter = Counter()
+    login_statuses: Counter = Counter()
+    deadline = time.perf_counter() + args.duration
+    await asyncio.gather(
+        probe(deadline, args.probe_interval, probe_samples),
+        legitimate_user(victim, deadline, args.login_interval, login_samples, login_statuses),
+        *(
+            attacker(f"203.0.113.{index % args.attackers + 1}", targets, deadline, random.Random(rng.random()), attack_statuses)
+            for index in range(args.concurrency)
+        ),
+    )
+    # The hashing pool drains after the deadline; let it finish before the next mode
+    while hashing_pool.in_flight or hashing_pool.queue_depth:
+        await asyncio.sleep(0.05)
+
+    return {
+        "attack": {
+            "requests": sum(attack_statuses.values()),
+            "status_codes": {str(status): count for status, count in sorted(attack_statuses.items())},
+        },
+        "password_verifications": hashing_pool.completed - verifications_before,
+        "public_listing": summarize(probe_samples),
+        "legitimate_login": {
+            **summarize(login_samples),
+            "status_codes": {str(status): count for status, count in sorted(login_statuses.items())},
+        },
+        "throttle": login_throttle.stats(),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as db:
+        emails = (await db.execute(
+            select(User.email).filter(User.email.like(f"%@{BENCH_EMAIL_DOMAIN}")).order_by(User.email)
+        )).scalars().all()
+    if len(emails) < 2:
+        raise SystemExit("No benchmark dataset found, run scripts/benchmarks/dataset.py first.")
+
+    print_json({
+        "attackers": args.attackers,
+        "concurrency": args.concurrency,
+        "duration_seconds": args.duration,
+        "hash_workers": hashing_pool.max_concurrency,
+        "unthrottled": await run_mode(False, emails, args),
+        "throttled": await run_mode(True, emails, args),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--attackers", type=int, default=4, help="distinct attacking client addresses")
+    parser.add_argument("--concurrency", type=int, default=64, help="attack requests in flight at once")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per mode")
+    parser.add_argument("--probe-interval", type=float, default=0.05, help="seconds between listing probes")
+    parser.add_argument("--login-interval", type=float, default=2.5, help="seconds between legitimate logins")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,87 @@
+"""Synthetic dataset for the load benchmarks: N users per department role and M articles.
+
+Usage:
+    python scripts/benchmarks/dataset.py [--users-per-role 20] [--articles 10000] [--seed 1]
+
+Runs against DATABASE_URL after scripts/seed.py has created the roles. Existing
+benchmark users (``bench.*@bench.local``) and their articles are replaced, so the
+same arguments always produce the same dataset. Every benchmark user's password
+is ``BENCH_PASSWORD``.
+"""
+import sys
+import asyncio
+import argparse
+import random
+import uuid
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[2]))
+
+from sqlalchemy import delete, insert, select
+
+from app.core.database import AsyncSessionLocal
+from app.core.security import get_password_hash
+from app.models import Article, Role, User
+from scripts.benchmarks.common import print_json, Timer
+from scripts.seed import generate_articles
+
+BENCH_PASSWORD = "Bench123!"
+BENCH_EMAIL_DOMAIN = "bench.local"
+INSERT_BATCH_SIZE = 1000
+
+
+def bench_email(role_name: str, index: int) -> str:
+    return f"bench.{role_name}.{index}@{BENCH_EMAIL_DOMAIN}"
+
+
+async def generate(users_per_role: int, articles: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    # Every user shares one hash; hashing thousands of passwords is not what is being measured
+    hashed_password = await get_password_hash(BENCH_PASSWORD)
+
+    async with AsyncSessionLocal() as db:
+        roles = (await db.execute(select(Role).filter(Role.name.like("author_%")).order_by(Role.name))).scalars().all()
+        if not roles:
+            raise SystemExit("No author roles found, run scripts/seed.py first.")
+
+        await db.execute(delete(User).filter(User.email.like(f"%@{BENCH_EMAIL_DOMAIN}")))
+
+        users = [
+            {
+                "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                "email": bench_email(role.name, index),
+                "first_name": role.name.removeprefix("author_").upper(),
+                "last_name": f"Bench {index}",
+                "hashed_password": hashed_password,
+                "role_id": role.id,
+            }
+            for role in roles
+            for index in range(users_per_role)
+        ]
+        for start in range(0, len(users), INSERT_BATCH_SIZE):
+            await db.execute(insert(User), users[start:start + INSERT_BATCH_SIZE])
+
+        generator = generate_articles(rng, [user["id"] for user in users], articles)
+        for start in range(0, articles, INSERT_BATCH_SIZE):
+            batch = [next(generator) for _ in range(min(INSERT_BATCH_SIZE, articles - start))]
+            await db.execute(insert(Article), batch)
+
+        await db.commit()
+
+    return {"roles": [role.name for role in roles], "users": len(users), "articles": articles}
+
+
+async def main(users_per_role: int, articles: int, seed: int) -> None:
+    with Timer() as timer:
+        report = await generate(users_per_role, articles, seed)
+    report["seconds"] = round(timer.elapsed, 2)
+    print_json(report)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users-per-role", type=int, default=20)
+    parser.add_argument("--articles", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=1, help="random seed; same seed, same dataset")
+    args = parser.parse_args()
+    asyncio.run(main(args.users_per_role, args.articles, args.seed))
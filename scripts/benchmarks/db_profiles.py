@@ -0,0 +1,96 @@
+"""Throughput of repository queries under each DB engine profile.
+
+Usage:
+    python scripts/benchmarks/db_profiles.py [--concurrency 16] [--duration 10]
+
+Runs against DATABASE_URL, which must hold seeded users and articles (see
+scripts/seed.py). Point it straight at Postgres to compare both profiles; a
+transaction-mode pgbouncer only supports the "pgbouncer" profile.
+"""
+import sys
+import asyncio
+import argparse
+import random
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[2]))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import create_engine, engine_options
+from app.models import Article, User
+from app.repositories import article_repo, user_repo
+from scripts.benchmarks.common import summarize, print_json
+
+PROFILES = ["pgbouncer", "direct"]
+
+
+async def load_keys(session_factory) -> tuple[list, list]:
+    async with session_factory() as db:
+        article_ids = (await db.execute(select(Article.id).limit(1000))).scalars().all()
+        emails = (await db.execute(select(User.email).limit(1000))).scalars().all()
+    if not article_ids or not emails:
+        raise SystemExit("Database needs users and articles, run scripts/seed.py first.")
+    return article_ids, emails
+
+
+async def worker(session_factory, deadline: float, article_ids: list, emails: list, samples: list[float]) -> None:
+    operations = [
+        lambda db: article_repo.get_page_rows(db, limit=20),
+        lambda db: article_repo.get_by_id(db, random.choice(article_ids)),
+        lambda db: user_repo.get_by_email(db, random.choice(emails)),
+    ]
+    while time.perf_counter() < deadline:
+        operation = random.choice(operations)
+        started = time.perf_counter()
+        async with session_factory() as db:
+            await operation(db)
+        samples.append(time.perf_counter() - started)
+
+
+async def run_profile(profile: str, concurrency: int, duration: float) -> dict:
+    engine = create_engine(profile)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        article_ids, emails = await load_keys(session_factory)
+
+        # Warm-up fills the pool and, for "direct", the statement caches
+        await asyncio.gather(*(
+            worker(session_factory, time.perf_counter() + 1, article_ids, emails, [])
+            for _ in range(concurrency)
+        ))
+
+        samples: list[float] = []
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            worker(session_factory, started + duration, article_ids, emails, samples)
+            for _ in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+    finally:
+        await engine.dispose()
+
+    options = engine_options(profile)
+    return {
+        "statement_cache_size": options["connect_args"]["statement_cache_size"],
+        "pool_size": options["pool_size"],
+        "queries": summarize(samples, elapsed),
+    }
+
+
+async def main(profiles: list[str], concurrency: int, duration: float) -> None:
+    report = {"concurrency": concurrency, "duration_seconds": duration}
+    for profile in profiles:
+        report[profile] = await run_profile(profile, concurrency, duration)
+    print_json(report)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", nargs="+", choices=PROFILES, default=PROFILES)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds measured per profile")
+    args = parser.parse_args()
+    asyncio.run(main(args.profiles, args.concurrency, args.duration))
@@ -0,0 +1,224 @@
+"""End-to-end load benchmark over a mixed workload.
+
+Usage:
+    python scripts/benchmarks/load.py [--clients 32] [--duration 30] [--warmup 5]
+        [--mix reads=80,writes=10,login=5,refresh=5] [--url http://127.0.0.1:8000]
+        [--output report.json]
+
+Needs the dataset from scripts/benchmarks/dataset.py in DATABASE_URL. Without
+``--url`` requests go to ``app.main:app`` in-process; with it, to a running
+server (e.g. ``uvicorn app.main:app --workers 4``) backed by the same database.
+
+Every simulated client logs in from the same address, so the login throttle
+would answer most logins with 429. It is switched off for in-process runs; start
+a server under test with ``LOGIN_THROTTLE_ENABLED=false``.
+
+Each client picks a workload per request according to ``--mix``:
+
+    reads    public listing pages (full and summary), article detail, search
+    writes   create an article as the client's author, then update it
+    login    password login, as in a login burst
+    refresh  rotate the client's refresh token
+
+Reports p50/p95/p99 latency and requests per second per workload and overall,
+as JSON meant to be diffed between releases.
+"""
+import sys
+import asyncio
+import argparse
+import json
+import random
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[2]))
+
+import httpx
+from sqlalchemy import select
+
+from app.main import app
+from app.core.database import AsyncSessionLocal
+from app.core.rate_limit import login_throttle
+from app.models import Article, User
+from scripts.benchmarks.common import summarize, print_json
+from scripts.benchmarks.dataset import BENCH_EMAIL_DOMAIN, BENCH_PASSWORD
+from scripts.seed import WORDS
+
+API = "/api/v1"
+WORKLOADS = ["reads", "writes", "login", "refresh"]
+
+
+class Client:
+    """One simulated user with its own session tokens."""
+
+    def __init__(self, http: httpx.AsyncClient, email: str, article_ids: list, rng: random.Random):
+        self.http = http
+        self.email = email
+        self.article_ids = article_ids
+        self.rng = rng
+        self.access_token = None
+        self.refresh_token = None
+
+    def _store_tokens(self, response: httpx.Response) -> None:
+        if response.status_code == 200:
+            tokens = response.json()
+            self.access_token = tokens["access_token"]
+            self.refresh_token = tokens["refresh_token"]
+
+    async def login(self) -> httpx.Response:
+        response = await self.http.post(f"{API}/auth/login", params={"email": self.email, "password": BENCH_PASSWORD})
+        self._store_tokens(response)
+        return response
+
+    async def refresh(self) -> httpx.Response:
+        response = await self.http.post(f"{API}/auth/refresh", json={"refresh_token": self.refresh_token})
+        self._store_tokens(response)
+        return response
+
+    async def read(self) -> httpx.Response:
+        choice = self.rng.random()
+        if choice < 0.35:
+            return await self.http.get(f"{API}/articles/", params={"limit": 20})
+        if choice < 0.55:
+            return await self.http.get(f"{API}/articles/", params={"limit": 20, "view": "summary", "excerpt_length": 200})
+        if choice < 0.85:
+            return await self.http.get(f"{API}/articles/{self.rng.choice(self.article_ids)}")
+        return await self.http.get(f"{API}/articles/search", params={"q": self.rng.choice(WORDS)})
+
+    async def write(self) -> list[httpx.Response]:
+        headers = {"Authorization": f"Bearer {self.access_token}"}
+        created = await self.http.post(
+            f"{API}/articles/",
+            json={"title": "Load test article", "body": " ".join(self.rng.choices(WORDS, k=60))},
+            headers=headers,
+        )
+        if created.status_code != 201:
+            return [created]
+        updated = await self.http.put(
+            f"{API}/articles/{created.json()['id']}", json={"title": "Load test article (edited)"}, headers=headers
+        )
+        return [created, updated]
+
+
+class Results:
+    def __init__(self):
+        self.samples: dict[str, list[float]] = {workload: [] for workload in WORKLOADS}
+        self.statuses: dict[str, Counter] = {workload: Counter() for workload in WORKLOADS}
+
+    def record(self, workload: str, elapsed: float, responses: list[httpx.Response]) -> None:
+        # Multi-request operations are recorded per request, each with an equal share of the time
+        for response in responses:
+            self.samples[workload].append(elapsed / len(responses))
+            self.statuses[workload][response.status_code] += 1
+
+    def report(self, elapsed: float) -> dict:
+        report = {}
+        for workload in WORKLOADS:
+            if not self.samples[workload]:
+                continue
+            report[workload] = summarize(self.samples[workload], elapsed)
+            report[workload]["errors"] = sum(
+                count for status, count in self.statuses[workload].items() if status >= 400
+            )
+            report[workload]["status_codes"] = {str(status): count for status, count in sorted(self.statuses[workload].items())}
+        everything = [sample for samples in self.samples.values() for sample in samples]
+        report["overall"] = summarize(everything, elapsed)
+        return report
+
+
+async def run_client(client: Client, mix: dict[str, int], deadline: float, results: Results) -> None:
+    workloads, weights = zip(*mix.items())
+    while time.perf_counter() < deadline:
+        workload = client.rng.choices(workloads, weights)[0]
+        started = time.perf_counter()
+        if workload == "reads":
+            responses = [await client.read()]
+        elif workload == "writes":
+            responses = await client.write()
+        elif workload == "login":
+            responses = [await client.login()]
+        else:
+            responses = [await client.refresh()]
+        results.record(workload, time.perf_counter() - started, responses)
+
+
+async def load_keys() -> tuple[list[str], list]:
+    async with AsyncSessionLocal() as db:
+        emails = (await db.execute(
+            select(User.email).filter(User.email.like(f"%@{BENCH_EMAIL_DOMAIN}")).order_by(User.email)
+        )).scalars().all()
+        article_ids = (await db.execute(select(Article.id).limit(5000))).scalars().all()
+    if not emails or not article_ids:
+        raise SystemExit("No benchmark dataset found, run scripts/benchmarks/dataset.py first.")
+    return emails, article_ids
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in WORKLOADS or not weight.isdigit():
+            raise argparse.ArgumentTypeError(f"expected workload=weight with workload in {WORKLOADS}, got {part!r}")
+        if int(weight):
+            mix[name] = int(weight)
+    if not mix:
+        raise argparse.ArgumentTypeError("mix has no workload with a positive weight")
+    return mix
+
+
+async def main(clients: int, duration: float, warmup: float, mix: dict[str, int], url: str | None, seed: int) -> dict:
+    emails, article_ids = await load_keys()
+    if url:
+        transport, base_url = None, url
+    else:
+        transport, base_url = httpx.ASGITransport(app=app), "http://bench"
+        # Measures the login path itself, not the throttle's 429s
+        login_throttle.enabled = False
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, limits=limits, timeout=60) as http:
+        rng = random.Random(seed)
+        simulated = [
+            Client(http, emails[i % len(emails)], article_ids, random.Random(rng.random()))
+            for i in range(clients)
+        ]
+        # Sessions for writes and refresh are opened before measuring
+        await asyncio.gather(*(client.login() for client in simulated))
+        if any(client.access_token is None for client in simulated):
+            raise SystemExit("Some benchmark users could not log in; regenerate the dataset.")
+
+        if warmup:
+            deadline = time.perf_counter() + warmup
+            await asyncio.gather(*(run_client(client, mix, deadline, Results()) for client in simulated))
+
+        results = Results()
+        started = time.perf_counter()
+        await asyncio.gather(*(run_client(client, mix, started + duration, results) for client in simulated))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "target": url or "in-process",
+        "clients": clients,
+        "duration_seconds": duration,
+        "mix": mix,
+        "dataset": {"users": len(emails), "articles_sampled": len(article_ids)},
+        "results": results.report(elapsed),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=32, help="concurrent simulated users")
+    parser.add_argument("--duration", type=float, default=30.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="unmeasured seconds before measuring")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("reads=80,writes=10,login=5,refresh=5"))
+    parser.add_argument("--url", help="base URL of a running server; in-process when omitted")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(main(args.clients, args.duration, args.warmup, args.mix, args.url, args.seed))
+    print_json(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, default=str))
@@ -0,0 +1,81 @@
+"""p99 latency of an unrelated endpoint (GET /) while a burst of argon2
+password verifications runs, with hashing inline on the event loop versus in
+the hashing pool.
+
+Usage:
+    python scripts/benchmarks/login_burst.py [--logins 64] [--probe-interval 0.005]
+
+No database is needed; the burst calls the same hashing functions
+``AuthService.authenticate_user`` uses.
+"""
+import sys
+import asyncio
+import argparse
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[2]))
+
+from app.main import app
+from app.core.hashing import hashing_pool
+from app.core.security import pwd_context, verify_password
+from scripts.benchmarks.common import asgi_request, summarize, print_json, Timer
+
+
+async def inline_login(hashed: str) -> None:
+    # The pre-pool behaviour: argon2 verify directly on the event loop
+    pwd_context.verify("wrong-password", hashed)
+
+
+async def pooled_login(hashed: str) -> None:
+    await verify_password("wrong-password", hashed)
+
+
+async def probe(stop: asyncio.Event, interval: float, samples: list[float]) -> None:
+    # Latency is measured from when each request was due, so time spent with the
+    # event loop blocked counts against it instead of silently skipping probes.
+    # After ``stop`` the probe keeps going until it has caught up with its schedule.
+    due = time.perf_counter()
+    while True:
+        status, _, _ = await asgi_request(app, "GET", "/")
+        assert status == 200
+        latency = time.perf_counter() - due
+        samples.append(latency)
+        if stop.is_set() and latency < interval:
+            return
+        due += interval
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+
+
+async def run_mode(login, hashed: str, logins: int, interval: float) -> dict:
+    samples: list[float] = []
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(stop, interval, samples))
+    await asyncio.sleep(interval * 10)
+
+    with Timer() as burst:
+        await asyncio.gather(*(login(hashed) for _ in range(logins)))
+
+    stop.set()
+    await probe_task
+    return {"burst_seconds": round(burst.elapsed, 3), "unrelated_endpoint": summarize(samples)}
+
+
+async def main(logins: int, interval: float) -> None:
+    hashed = pwd_context.hash("correct-password")
+    report = {
+        "logins": logins,
+        "hash_workers": hashing_pool.max_concurrency,
+        "inline": await run_mode(inline_login, hashed, logins, interval),
+        "pool": await run_mode(pooled_login, hashed, logins, interval),
+        "pool_stats": hashing_pool.stats(),
+    }
+    print_json(report)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=64, help="concurrent password verifications in the burst")
+    parser.add_argument("--probe-interval", type=float, default=0.005, help="seconds between probe requests")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.probe_interval))
@@ -0,0 +1,114 @@
+"""Serialization cost of one listing response per 10k articles.
+
+Usage:
+    python scripts/benchmarks/serialization.py [--articles 10000] [--repeat 5]
+
+"validated" is the previous path: ORM objects copied into ``ArticleWithAuthor``,
+re-validated against the route's ``response_model`` and encoded with the stdlib.
+"fast" maps the projected rows straight to dicts and encodes them with
+``FastJSONResponse``. No database is needed; rows are generated in memory.
+"""
+import sys
+import asyncio
+import argparse
+import time
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[2]))
+
+import app.main  # noqa: F401  (loads modules in the order the app does)
+from app.main import app
+from app.models import Article, User
+from app.models.article import ArticleStatus
+from app.repositories.article import WITH_AUTHOR_COLUMNS
+from app.schemas.article import ArticlePage
+from app.services.article_service import _to_article_with_author, _to_page
+from app.core.responses import FastJSONResponse
+from scripts.benchmarks.common import print_json
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+ArticleRow = namedtuple("ArticleRow", [column.key for column in WITH_AUTHOR_COLUMNS])
+
+
+def generate(count: int) -> tuple[list[Article], list[ArticleRow]]:
+    authors = [
+        User(id=uuid.uuid4(), first_name=f"First{i}", last_name=f"Last{i}", email=f"author{i}@example.com")
+        for i in range(50)
+    ]
+    now = datetime.now(timezone.utc)
+    articles, rows = [], []
+    for i in range(count):
+        author = authors[i % len(authors)]
+        created_at = now - timedelta(minutes=i)
+        fields = dict(
+            id=uuid.uuid4(),
+            author_id=author.id,
+            title=f"Article {i}",
+            body="Lorem ipsum dolor sit amet. " * 20,
+            image_path=None,
+            image_alt_text=None,
+            status=ArticleStatus.APPROVED,
+            created_at=created_at,
+            updated_at=created_at,
+            approved_at=created_at,
+            archived_at=None,
+        )
+        articles.append(Article(author=author, **fields))
+        rows.append(ArticleRow(
+            author_first_name=author.first_name,
+            author_last_name=author.last_name,
+            author_email=author.email,
+            **fields,
+        ))
+    return articles, rows
+
+
+def listing_route() -> APIRoute:
+    return next(
+        route for route in app.routes
+        if isinstance(route, APIRoute) and route.path == "/api/v1/articles/" and "GET" in route.methods
+    )
+
+
+async def validated(articles: list[Article], field) -> bytes:
+    page = ArticlePage(items=[_to_article_with_author(article) for article in articles])
+    content = await serialize_response(field=field, response_content=page)
+    return JSONResponse(content).body
+
+
+async def fast(rows: list[ArticleRow]) -> bytes:
+    return FastJSONResponse(_to_page(rows, limit=len(rows))).body
+
+
+async def measure(run, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = await run()
+        timings.append(time.perf_counter() - started)
+    return {"best_ms": round(min(timings) * 1000, 2), "mean_ms": round(sum(timings) / repeat * 1000, 2), "bytes": len(body)}
+
+
+async def main(count: int, repeat: int) -> None:
+    articles, rows = generate(count)
+    field = listing_route().secure_cloned_response_field
+    report = {
+        "articles": count,
+        "repeat": repeat,
+        "validated": await measure(lambda: validated(articles, field), repeat),
+        "fast": await measure(lambda: fast(rows), repeat),
+    }
+    report["speedup"] = round(report["validated"]["best_ms"] / report["fast"]["best_ms"], 1)
+    print_json(report)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.articles, args.repeat))
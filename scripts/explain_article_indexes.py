@@ -0,0 +1,133 @@
+"""Show EXPLAIN plans for the article listing queries with and without the
+listing indexes from migration e198a64289ba.
+
+Usage:
+    python scripts/explain_article_indexes.py [--articles 100000]
+
+Run ``alembic upgrade head`` and ``python scripts/seed.py`` first. Missing
+articles are generated for the seeded users until the table holds
+``--articles`` rows. The "before" plans are taken inside a transaction that
+drops the listing indexes and is rolled back afterwards.
+"""
+import sys
+import asyncio
+import argparse
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from app.core.database import engine
+
+
+LISTING_INDEXES = [
+    "ix_articles_created_at_id",
+    "ix_articles_status_created_at",
+    "ix_articles_author_id_created_at",
+]
+
+QUERIES = {
+    "public listing, first page": """
+        SELECT articles.*, users.first_name, users.last_name, users.email
+        FROM articles JOIN users ON users.id = articles.author_id
+        ORDER BY articles.created_at DESC, articles.id DESC
+        LIMIT 21
+    """,
+    "public listing, deep cursor": """
+        SELECT articles.*, users.first_name, users.last_name, users.email
+        FROM articles JOIN users ON users.id = articles.author_id
+        WHERE (articles.created_at, articles.id) < (:cursor_created_at, :cursor_id)
+        ORDER BY articles.created_at DESC, articles.id DESC
+        LIMIT 21
+    """,
+    "by status": """
+        SELECT * FROM articles
+        WHERE status = 'APPROVED'
+        ORDER BY created_at DESC, id DESC
+        LIMIT 21
+    """,
+    "by author (my-articles)": """
+        SELECT * FROM articles
+        WHERE author_id = :author_id
+        ORDER BY created_at DESC, id DESC
+        LIMIT 21
+    """,
+}
+
+
+async def ensure_dataset(conn: AsyncConnection, target: int) -> None:
+    existing = (await conn.execute(text("SELECT count(*) FROM articles"))).scalar_one()
+    missing = target - existing
+    if missing <= 0:
+        print(f"ℹ️  {existing} articles present, no data generated.")
+        return
+
+    users = (await conn.execute(text("SELECT count(*) FROM users"))).scalar_one()
+    if not users:
+        raise SystemExit("No users found, run scripts/seed.py first.")
+
+    await conn.execute(
+        text("""
+            INSERT INTO articles (id, author_id, title, body, status, created_at, updated_at)
+            SELECT
+                gen_random_uuid(),
+                authors.ids[1 + g % array_length(authors.ids, 1)],
+                'Generated article ' || g,
+                repeat('Lorem ipsum dolor sit amet. ', 40),
+                (ARRAY['DRAFT', 'PENDING', 'APPROVED', 'ARCHIVED'])[1 + g % 4]::articlestatus,
+                timezone('UTC', now()) - g * interval '1 minute',
+                timezone('UTC', now()) - g * interval '1 minute'
+            FROM generate_series(1, :missing) AS g,
+                 (SELECT array_agg(id) AS ids FROM users) AS authors
+        """),
+        {"missing": missing},
+    )
+    await conn.commit()
+    print(f"✅ Generated {missing} articles.")
+
+
+async def explain_all(conn: AsyncConnection, params: dict) -> None:
+    for name, sql in QUERIES.items():
+        plan = (await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params)).scalars().all()
+        print(f"\n--- {name}")
+        print("\n".join(plan))
+
+
+async def main(target: int) -> None:
+    async with engine.connect() as conn:
+        await ensure_dataset(conn, target)
+        await conn.execute(text("ANALYZE articles"))
+        await conn.commit()
+
+        author_id = (await conn.execute(text("SELECT author_id FROM articles LIMIT 1"))).scalar_one()
+        cursor_row = (await conn.execute(text(
+            "SELECT created_at, id FROM articles ORDER BY created_at DESC, id DESC OFFSET :offset LIMIT 1"
+        ), {"offset": target // 2})).one()
+        params = {
+            "author_id": author_id,
+            "cursor_created_at": cursor_row.created_at,
+            "cursor_id": cursor_row.id,
+        }
+
+        await conn.rollback()
+
+        print("\n========== BEFORE (listing indexes dropped) ==========")
+        transaction = await conn.begin()
+        for index in LISTING_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {index}"))
+        await explain_all(conn, params)
+        await transaction.rollback()
+
+        print("\n========== AFTER (listing indexes present) ==========")
+        await explain_all(conn, params)
+        await conn.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=100_000, help="minimum number of articles to explain against")
+    args = parser.parse_args()
+    asyncio.run(main(args.articles))
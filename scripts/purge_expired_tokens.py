@@ -0,0 +1,37 @@
+"""Delete expired refresh tokens and token revocations.
+
+Usage:
+    python scripts/purge_expired_tokens.py [--batch-size 5000]
+
+Safe to run from cron while the API is serving: refresh tokens are deleted in
+batches with a commit after each, so no long-running lock is held.
+"""
+import sys
+import asyncio
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.database import AsyncSessionLocal, engine
+from app.repositories import refresh_token_repo, revoked_token_repo
+
+
+async def purge(batch_size: int) -> None:
+    now = datetime.now(timezone.utc)
+    async with AsyncSessionLocal() as db:
+        refresh_deleted = await refresh_token_repo.delete_expired(db, now=now, batch_size=batch_size)
+        print(f"✅ Deleted {refresh_deleted} expired refresh tokens.")
+
+        revoked_deleted = await revoked_token_repo.delete_expired(db, now=now)
+        print(f"✅ Deleted {revoked_deleted} expired token revocations.")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=5000, help="rows deleted per transaction")
+    args = parser.parse_args()
+    asyncio.run(purge(args.batch_size))
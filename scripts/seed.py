@@ -1,14 +1,36 @@
 import sys
+import time
+import uuid
+import random
 import asyncio
+import argparse
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from sqlalchemy import select
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import selectinload
 from app.core.database import AsyncSessionLocal
 from app.core.security import get_password_hash
-from app.models import User, Role, Permission
+from app.models import Article, User, Role, Permission
+from app.models.article import ArticleStatus
+
+# Bulk mode
+BULK_EMAIL_DOMAIN = "bulk.ceit.edu"
+BULK_PASSWORD = "Bulk123!"
+# asyncpg accepts at most 32767 bind parameters per statement
+MAX_BIND_PARAMS = 32767
+ARTICLE_COPY_COLUMNS = [
+    "id", "author_id", "title", "body", "status", "created_at", "updated_at", "approved_at", "archived_at"
+]
+WORDS = (
+    "engineering campus research student faculty laboratory circuit bridge network "
+    "software power structure design thesis seminar project grant energy signal data "
+    "concrete robotics security cloud survey analysis department award"
+).split()
+STATUS_WEIGHTS = {ArticleStatus.APPROVED: 70, ArticleStatus.PENDING: 15, ArticleStatus.DRAFT: 10, ArticleStatus.ARCHIVED: 5}
 
 
 async def seed_db():
@@ -110,7 +132,7 @@ async def seed_db():
                             first_name=user_data["first_name"],
                             last_name=user_data["last_name"],
                             role_id=role.id,
-                            hashed_password=get_password_hash("Admin123!")
+                            hashed_password=await get_password_hash("Admin123!")
                         )
 
                         db.add(new_user)
@@ -126,5 +148,171 @@ async def seed_db():
             await db.rollback()
 
 
+class Progress:
+    """Prints done/total and rows per second after every chunk."""
+
+    def __init__(self, label: str, total: int):
+        self.label = label
+        self.total = total
+        self.done = 0
+        self.started = time.perf_counter()
+
+    def advance(self, rows: int) -> None:
+        self.done += rows
+        elapsed = time.perf_counter() - self.started
+        rate = self.done / elapsed if elapsed else 0
+        print(f"⏳ {self.label}: {self.done:,}/{self.total:,} ({self.done * 100 // max(self.total, 1)}%) {rate:,.0f} rows/s")
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+
+async def insert_chunked(db, table, rows: list[dict]) -> None:
+    """Multi-row INSERT ... ON CONFLICT DO NOTHING, split to stay under the bind parameter limit."""
+    per_statement = MAX_BIND_PARAMS // len(rows[0])
+    for start in range(0, len(rows), per_statement):
+        await db.execute(insert(table).values(rows[start:start + per_statement]).on_conflict_do_nothing())
+
+
+async def hash_passwords(count: int, unique: bool) -> list[str]:
+    """``count`` hashes of BULK_PASSWORD: one shared hash, or one per user.
+
+    Unique hashes go through the app's hashing pool, so PASSWORD_HASH_EXECUTOR and
+    PASSWORD_HASH_WORKERS decide how many are computed in parallel.
+    """
+    if not unique:
+        return [await get_password_hash(BULK_PASSWORD)] * count
+    return list(await asyncio.gather(*(get_password_hash(BULK_PASSWORD) for _ in range(count))))
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def generate_articles(rng: random.Random, author_ids: list, count: int):
+    now = datetime.now(timezone.utc)
+    statuses, weights = zip(*STATUS_WEIGHTS.items())
+    for _ in range(count):
+        created_at = now - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+        article_status = rng.choices(statuses, weights)[0]
+        # Reviewed articles carry the stamp a real transition would have set, some time after creation
+        stamp = min(now, created_at + timedelta(seconds=rng.randrange(7 * 24 * 3600)))
+        yield {
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "author_id": rng.choice(author_ids),
+            "title": sentence(rng, rng.randint(3, 9)),
+            "body": " ".join(sentence(rng, rng.randint(8, 20)) + "." for _ in range(rng.randint(5, 40))),
+            "status": article_status,
+            "created_at": created_at,
+            "updated_at": stamp if article_status in (ArticleStatus.APPROVED, ArticleStatus.ARCHIVED) else created_at,
+            "approved_at": stamp if article_status == ArticleStatus.APPROVED else None,
+            "archived_at": stamp if article_status == ArticleStatus.ARCHIVED else None,
+        }
+
+
+async def copy_articles(db, rows: list[dict]) -> None:
+    """COPY rows through the session's asyncpg connection into a staging table, then
+    move them into articles skipping ids that already exist, so reruns with the
+    same seed add nothing instead of failing on the primary key."""
+    columns = ", ".join(ARTICLE_COPY_COLUMNS)
+    await db.execute(text(
+        f"CREATE TEMP TABLE articles_copy ON COMMIT DROP AS SELECT {columns} FROM articles WITH NO DATA"
+    ))
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    records = [
+        # The enum is stored under its member name
+        tuple(row[column].name if column == "status" else row[column] for column in ARTICLE_COPY_COLUMNS)
+        for row in rows
+    ]
+    await raw.driver_connection.copy_records_to_table("articles_copy", records=records, columns=ARTICLE_COPY_COLUMNS)
+    await db.execute(text(
+        f"INSERT INTO articles ({columns}) SELECT {columns} FROM articles_copy ON CONFLICT DO NOTHING"
+    ))
+
+
+async def seed_bulk(
+    users: int,
+    articles: int,
+    chunk_size: int,
+    method: str,
+    unique_passwords: bool,
+    seed: int
+) -> None:
+    rng = random.Random(seed)
+    started = time.perf_counter()
+
+    async with AsyncSessionLocal() as db:
+        roles = (await db.execute(select(Role).filter(Role.name.like("author_%")).order_by(Role.name))).scalars().all()
+
+        hashing = Progress("password hashes", users)
+        hashes = await hash_passwords(users, unique_passwords)
+        hashing.advance(len(hashes))
+
+        # Users are spread evenly over the department roles; reruns skip existing emails
+        progress = Progress("users", users)
+        for start in range(0, users, chunk_size):
+            rows = [
+                {
+                    "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                    "email": f"user{index}@{BULK_EMAIL_DOMAIN}",
+                    "first_name": "Bulk",
+                    "last_name": f"User {index}",
+                    "hashed_password": hashes[index],
+                    "role_id": roles[index % len(roles)].id,
+                }
+                for index in range(start, min(start + chunk_size, users))
+            ]
+            await insert_chunked(db, User, rows)
+            await db.commit()
+            progress.advance(len(rows))
+
+        author_ids = (await db.execute(
+            select(User.id).filter(User.email.like(f"%@{BULK_EMAIL_DOMAIN}"))
+        )).scalars().all()
+
+        progress = Progress(f"articles ({method})", articles)
+        generator = generate_articles(rng, author_ids, articles)
+        for start in range(0, articles, chunk_size):
+            rows = [next(generator) for _ in range(min(chunk_size, articles - start))]
+            if method == "copy":
+                await copy_articles(db, rows)
+            else:
+                await insert_chunked(db, Article, rows)
+            await db.commit()
+            progress.advance(len(rows))
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"✅ Bulk seeding completed: {users:,} users, {articles:,} articles in {elapsed:.1f}s "
+        f"({(users + articles) / elapsed:,.0f} rows/s)."
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    await seed_db()
+    if args.bulk:
+        await seed_bulk(
+            users=args.users,
+            articles=args.articles,
+            chunk_size=args.chunk_size,
+            method=args.method,
+            unique_passwords=args.unique_passwords,
+            seed=args.seed,
+        )
+
+
 if __name__ == "__main__":
-    asyncio.run(seed_db())
+    parser = argparse.ArgumentParser(description="Seed roles, permissions and demo users; --bulk adds a large synthetic dataset.")
+    parser.add_argument("--bulk", action="store_true", help=f"also generate users (user<N>@{BULK_EMAIL_DOMAIN}, password {BULK_PASSWORD}) and articles")
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--articles", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="rows per commit")
+    parser.add_argument("--method", choices=["insert", "copy"], default="copy", help="how articles are loaded")
+    parser.add_argument(
+        "--unique-passwords", action="store_true",
+        help="hash every user's password separately (in parallel per PASSWORD_HASH_WORKERS) instead of reusing one hash"
+    )
+    parser.add_argument("--seed", type=int, default=1, help="random seed for generated data")
+    asyncio.run(main(parser.parse_args()))
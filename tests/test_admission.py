@@ -0,0 +1,58 @@
+"""Admission control; no database needed."""
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.core.admission import AUTH, READ, WRITE, AdmissionController, ConcurrencyLimiter
+from app.middleware.admission import AdmissionMiddleware
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("method, path, expected", [
+    ("GET", "/api/v1/articles/", READ),
+    ("POST", "/api/v1/articles/", WRITE),
+    ("POST", "/api/v1/auth/login", AUTH),
+    ("GET", "/metrics", None),
+    ("GET", "/media/images/abc.png", None),
+])
+def test_route_class(method, path, expected):
+    assert AdmissionController.route_class(method, path) == expected
+
+
+async def test_queue_full_is_rejected():
+    limiter = ConcurrencyLimiter(1, queue_size=1, timeout=1.0)
+    assert await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not await limiter.acquire()
+
+    limiter.release()
+    assert await waiting
+    assert limiter.active == 1 and limiter.queued == 0
+
+
+async def test_queue_deadline():
+    limiter = ConcurrencyLimiter(1, queue_size=4, timeout=0.01)
+    assert await limiter.acquire()
+    assert not await limiter.acquire()
+    assert limiter.queued == 0
+
+
+async def test_pool_saturation_sheds_with_retry_after():
+    controller = AdmissionController(
+        limiters={name: ConcurrencyLimiter(8, 8, 1.0) for name in (READ, WRITE, AUTH)},
+        pool_wait=lambda: 1.0,
+        pool_wait_threshold=0.5,
+        retry_after=3,
+    )
+    shedding = AdmissionMiddleware(app, controller=controller)
+    async with AsyncClient(transport=ASGITransport(app=shedding), base_url="http://test") as client:
+        response = await client.get("/api/v1/articles/")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "3"
+        # Never limited: it needs no database connection
+        assert (await client.get("/")).status_code == 200
+    assert controller.limiters[READ].active == 0
@@ -0,0 +1,160 @@
+"""Upper bounds on the SQL statements each service call and endpoint sends.
+
+Each test runs at every size in ``DATASET_SIZES``. If a change makes a call load
+relationships lazily or per row, the count grows with the dataset and the
+budget fails with the offending statements listed.
+"""
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+
+from app.main import app
+from app.core.rate_limit import login_throttle
+from app.models.article import ArticleStatus
+from app.repositories.article import article_repo
+from app.schemas import TokenData
+from app.schemas.article import ArticleCreate, ArticleUpdate
+from app.services import article_service, auth_service
+from app.services.role_permissions import role_permission_snapshot
+
+pytestmark = pytest.mark.anyio
+
+
+def as_current_user(user, permissions=None) -> TokenData:
+    return TokenData(
+        sub=user.id,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        role_name=user.role.name,
+        permissions=permissions or [perm.name for perm in user.role.permissions],
+    )
+
+
+async def new_article(db, author):
+    return await article_repo.create_article(db, ArticleCreate(title="Scratch", body="Scratch body"), author.id)
+
+
+# --- Articles -----------------------------------------------------------------
+
+async def test_get_article(dataset, db, query_budget):
+    # Article, then its author and the author's role via selectinload
+    with query_budget(3):
+        await article_service.get_article(db, dataset.articles[0].id)
+
+
+async def test_get_article_cached(dataset, db, query_budget):
+    article = await article_service.get_article(db, dataset.articles[0].id)
+    with query_budget(0):
+        await article_service.get_article(db, article.id, updated_at=article.updated_at)
+
+
+async def test_get_all_articles(dataset, db, query_budget):
+    with query_budget(1):
+        await article_service.get_all_articles(db, limit=20)
+
+
+async def test_get_article_summaries(dataset, db, query_budget):
+    with query_budget(1):
+        await article_service.get_article_summaries(db, limit=20, excerpt_length=100)
+
+
+async def test_get_my_articles(dataset, db, query_budget):
+    with query_budget(1):
+        await article_service.get_my_articles(db, dataset.authors[0].id, limit=20)
+
+
+async def test_search_articles(dataset, db, query_budget):
+    with query_budget(1):
+        await article_service.search_articles(db, "engineering", limit=20)
+
+
+async def test_create_article(dataset, db, query_budget):
+    # INSERT, then the refresh that loads server defaults
+    with query_budget(2):
+        await article_service.create_article(db, ArticleCreate(title="New", body="New body"), dataset.authors[0].id)
+
+
+async def test_update_article(dataset, db, query_budget):
+    article = await new_article(db, dataset.authors[0])
+    with query_budget(1):
+        await article_service.update_article(
+            db, article.id, ArticleUpdate(title="Updated"), as_current_user(dataset.authors[0])
+        )
+
+
+async def test_delete_article(dataset, db, query_budget):
+    article = await new_article(db, dataset.authors[0])
+    with query_budget(1):
+        await article_service.delete_article(db, article.id, as_current_user(dataset.authors[0]))
+
+
+async def test_bulk_transition_status(dataset, db, query_budget):
+    ids = [article.id for article in dataset.articles]
+    with query_budget(1):
+        await article_service.bulk_transition_status(
+            db, ids, ArticleStatus.ARCHIVED, as_current_user(dataset.admin)
+        )
+
+
+# --- Auth ---------------------------------------------------------------------
+
+async def test_authenticate_user(dataset, db, query_budget):
+    await role_permission_snapshot.load(db)
+    # User with the authz version, then the refresh token INSERT
+    with query_budget(2):
+        await auth_service.authenticate_user(db, dataset.authors[0].email, dataset.password)
+
+
+async def test_authenticate_user_after_role_change(dataset, db, query_budget):
+    await role_permission_snapshot.load(db)
+    await db.execute(text("UPDATE roles SET description = 'changed' WHERE name = 'author_ce'"))
+    await db.commit()
+    # The bumped authz version costs one snapshot reload
+    with query_budget(3):
+        await auth_service.authenticate_user(db, dataset.authors[0].email, dataset.password)
+
+
+async def test_refresh_access_token(dataset, db, query_budget):
+    token = await auth_service.authenticate_user(db, dataset.authors[0].email, dataset.password)
+    # Rotating UPDATE and successor INSERT, then the user with the authz version
+    with query_budget(3):
+        await auth_service.refresh_access_token(db, token.refresh_token)
+
+
+# --- Endpoints ----------------------------------------------------------------
+
+async def request(method: str, url: str, **kwargs):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.request(method, url, **kwargs)
+
+
+async def test_list_articles_endpoint(dataset, query_budget):
+    # Page versions for the ETag, then the page itself
+    with query_budget(2):
+        response = await request("GET", "/api/v1/articles/", params={"limit": 20})
+    assert response.status_code == 200
+
+
+async def test_list_articles_endpoint_not_modified(dataset, query_budget):
+    etag = (await request("GET", "/api/v1/articles/", params={"limit": 20})).headers["etag"]
+    with query_budget(1):
+        response = await request("GET", "/api/v1/articles/", params={"limit": 20}, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+async def test_get_article_endpoint(dataset, query_budget):
+    # updated_at for the ETag, then the article with author and role
+    with query_budget(4):
+        response = await request("GET", f"/api/v1/articles/{dataset.articles[0].id}")
+    assert response.status_code == 200
+
+
+async def test_login_endpoint_throttled(dataset, query_budget):
+    params = {"email": dataset.authors[0].email, "password": "wrong"}
+    for _ in range(login_throttle.by_account.burst):
+        await request("POST", "/api/v1/auth/login", params=params)
+    # Rejected before the user lookup or the password hash
+    with query_budget(0):
+        response = await request("POST", "/api/v1/auth/login", params=params)
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) > 0
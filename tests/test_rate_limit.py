@@ -0,0 +1,42 @@
+"""Login throttle buckets and client addresses; no database needed."""
+from app.core.rate_limit import TokenBucketLimiter, client_address, _parse_networks
+
+PROXIES = _parse_networks(["10.0.0.0/8"])
+
+
+def test_burst_then_refill():
+    limiter = TokenBucketLimiter(burst=2, rate=1.0, maxsize=10)
+    assert limiter.acquire("a", now=0) == 0
+    assert limiter.acquire("a", now=0) == 0
+    assert limiter.acquire("a", now=0) == 1.0
+    assert limiter.acquire("a", now=0.5) == 0.5
+    assert limiter.acquire("a", now=1.0) == 0
+
+
+def test_idle_buckets_are_evicted():
+    limiter = TokenBucketLimiter(burst=2, rate=1.0, maxsize=10)
+    limiter.acquire("a", now=0)
+    limiter.acquire("b", now=1)
+    # "a" has been idle for longer than a full refill takes, "b" has not
+    limiter.acquire("c", now=2.5)
+    assert len(limiter) == 2
+    assert limiter.stats()["evictions"] == 1
+
+
+def test_size_is_bounded():
+    limiter = TokenBucketLimiter(burst=5, rate=0.001, maxsize=3)
+    for key in range(100):
+        limiter.acquire(key, now=0)
+    assert len(limiter) == 3
+    # The most recent keys survive
+    assert limiter.acquire(99, now=0) == 0 and limiter.stats()["evictions"] == 97
+
+
+def test_client_address_without_trusted_proxy():
+    assert client_address("203.0.113.5", "198.51.100.1", PROXIES) == "203.0.113.5"
+
+
+def test_client_address_behind_trusted_proxy():
+    # The leftmost hop is whatever the client sent and is not trusted
+    assert client_address("10.0.0.2", "1.2.3.4, 198.51.100.7, 10.0.0.3", PROXIES) == "198.51.100.7"
+    assert client_address("10.0.0.2", "10.0.0.3", PROXIES) == "10.0.0.2"
@@ -0,0 +1,10 @@
+"""Search highlights are escaped before matches are marked; no database needed."""
+from app.repositories.article import HIGHLIGHT_START, HIGHLIGHT_STOP
+from app.services.article_service import _highlight_html
+
+
+def test_content_markup_is_escaped():
+    headline = f'<img src=x onerror="alert(1)"> {HIGHLIGHT_START}engineering{HIGHLIGHT_STOP} & more'
+    assert _highlight_html(headline) == (
+        "&lt;img src=x onerror=&quot;alert(1)&quot;&gt; <mark>engineering</mark> &amp; more"
+    )
@@ -0,0 +1,33 @@
+"""Oversized multipart bodies are refused before parsing; no database needed."""
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.middleware.upload_limit import UploadLimitMiddleware
+
+pytestmark = pytest.mark.anyio
+
+PART_HEADER = b'--b\r\nContent-Disposition: form-data; name="file"; filename="a.png"\r\nContent-Type: image/png\r\n\r\n'
+
+
+async def post_image(**kwargs):
+    limited = UploadLimitMiddleware(app, max_bytes=1000)
+    async with AsyncClient(transport=ASGITransport(app=limited), base_url="http://test") as client:
+        return await client.post(f"/api/v1/articles/{uuid4()}/image", **kwargs)
+
+
+async def test_declared_length_over_limit():
+    response = await post_image(files={"file": ("a.png", b"\x89PNG\r\n\x1a\n" + bytes(5000))}, data={"alt_text": "a"})
+    assert response.status_code == 413
+
+
+async def test_streamed_body_cut_off_at_limit():
+    async def body():
+        yield PART_HEADER
+        for _ in range(10):
+            yield bytes(300)
+
+    response = await post_image(content=body(), headers={"content-type": "multipart/form-data; boundary=b"})
+    assert response.status_code == 413